@@ -0,0 +1,45 @@
+import os
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class BrainConfig:
+    """Local brain (Ollama) endpoints and timing, overridable via environment variables."""
+    url: str = "http://localhost:8000"
+    planner_url: str = "http://localhost:8000/v1"
+    executor_url: str = "http://localhost:8000/v1"
+    wait_seconds: float = 60.0
+    poll_interval: float = 2.0
+    unload_timeout: float = 15.0
+    keepalive_interval: float = 60.0
+
+    @staticmethod
+    def _native_root(openai_url: str) -> str:
+        url = openai_url.rstrip("/")
+        return url[:-3] if url.endswith("/v1") else url
+
+    @property
+    def planner_api_url(self) -> str:
+        """Ollama-native (/api) root serving the planner model."""
+        return self._native_root(self.planner_url)
+
+    @property
+    def executor_api_url(self) -> str:
+        """Ollama-native (/api) root serving the executor model."""
+        return self._native_root(self.executor_url)
+
+    @classmethod
+    def from_env(cls) -> "BrainConfig":
+        url = os.environ.get("AEON_BRAIN_URL", cls.url).rstrip("/")
+        planner_url = os.environ.get("AEON_PLANNER_URL", f"{url}/v1")
+        return cls(
+            url=url,
+            planner_url=planner_url,
+            executor_url=os.environ.get("AEON_EXECUTOR_URL", planner_url),
+            wait_seconds=float(os.environ.get("AEON_BRAIN_WAIT_SECONDS", cls.wait_seconds)),
+            poll_interval=float(os.environ.get("AEON_BRAIN_POLL_INTERVAL", cls.poll_interval)),
+            unload_timeout=float(os.environ.get("AEON_BRAIN_UNLOAD_TIMEOUT", cls.unload_timeout)),
+            keepalive_interval=float(os.environ.get("AEON_BRAIN_KEEPALIVE_SECONDS", cls.keepalive_interval)),
+        )
+
+# Read once at import; restart the agent to pick up changes
+BRAIN = BrainConfig.from_env()
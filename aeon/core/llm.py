@@ -1,24 +1,272 @@
 import os
-import openai
 import pathlib
-import sys
 import json
 import re
+import time
+import asyncio
+import hashlib
+import threading
+import atexit
+import importlib.util
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional
-sys.setrecursionlimit(2000)
-from .system_info import get_runtime_info
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Tuple
+from .config import BRAIN
+from .schemas import PLAN_SCHEMA, ACTION_SCHEMA, INTERRUPTION_SCHEMA, PLAN_AND_ACTION_SCHEMA
+from .utils import STDOUT_IS_TTY, json_dumps, json_dumps_key, json_loads as _json_loads, read_api_key
 from .logger import get_logger
-from .utils import estimate_tokens
 from .prompts import (
     SUMMARIZE_EXECUTION_PROMPT,
+    SUMMARIZE_EXECUTION_BATCH_PROMPT,
     ANALYZE_INTERRUPTION_PROMPT,
     SUMMARIZE_TEXT_PROMPT,
+    PLAN_AND_ACTION_INSTRUCTIONS,
 )
 
-# ANSI Colors for debug printing
-C_YELLOW = '\033[93m'
-C_RESET = '\033[0m'
+try:
+    # Optional: persists temperature-0 responses and summaries across runs (see _DISK_CACHE_TTLS)
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    # Optional: embeddings for the near-duplicate (semantic) cache, see _SemanticCache
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+# ANSI Colors for debug printing, off when stdout is not a terminal
+C_YELLOW = '\033[93m' if STDOUT_IS_TTY else ''
+C_RESET = '\033[0m' if STDOUT_IS_TTY else ''
+
+# Patterns used by _clean_json_response, compiled once at import
+# Only these characters matter to the brace scanner; finditer skips everything else in C
+_JSON_TOKEN_RE = re.compile(r'[{}"\\]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_EXACT_CACHE_DIR = pathlib.Path.home() / ".cache" / "aeon" / "llm"
+# Response-cache kinds that are also kept on disk, with their TTL in seconds: exact
+# temperature-0 completions and text/execution summaries, which depend only on their input
+_DISK_CACHE_TTLS = {"exact": 86400, "summary": 86400, "execution": 86400}
+# In-process entry lifetime. Keys hash the full prompt, so this bounds reuse rather than
+# guarding against stale input; disk kinds are refilled from disk once it lapses, so it
+# only matters for the others (interruption triage) and when diskcache is not installed
+_RESPONSE_CACHE_TTL = 1800
+# Semantic-cache cut-off for short inputs (think and summary queries), where
+# the default threshold would merge requests that differ in one meaningful word
+_STRICT_SIMILARITY = 0.92
+
+# Appended to the original prompt when a planner/executor response fails validation
+_RETRY_SUFFIX = (
+    "\n\n** RETRY - YOUR PREVIOUS RESPONSE WAS INVALID **\nError: {error}\nRaw output started with: {raw_start}...\n\n"
+    "You MUST output ONLY a valid, non-empty JSON object. No text before {{ or after }}. Use double quotes only."
+)
+
+# Shared pool for overlapping independent LLM calls (e.g. planner + speculative executor)
+_LLM_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="aeon-llm")
+
+class _JsonStreamScanner:
+    """Tracks brace depth over streamed text to detect when the first top-level
+    JSON object has closed. Ignores <think> blocks and braces inside strings."""
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escape_next = False
+        self.in_think = False
+        self.started = False
+        self._tail = ''  # last few chars, for tags split across chunks
+
+    def feed(self, text: str) -> bool:
+        """Consume a chunk of text; return True once a complete object has been seen."""
+        for char in text:
+            if self.depth == 0 and not self.in_string:
+                self._tail = (self._tail + char)[-8:]
+                if self.in_think:
+                    if self._tail.endswith('</think>'):
+                        self.in_think = False
+                    continue
+                if self._tail.endswith('<think>'):
+                    self.in_think = True
+                    continue
+            if self.escape_next:
+                self.escape_next = False
+                continue
+            if char == '\\':
+                self.escape_next = True
+                continue
+            if char == '"':
+                self.in_string = not self.in_string
+                continue
+            if self.in_string:
+                continue
+            if char == '{':
+                self.depth += 1
+                self.started = True
+            elif char == '}' and self.depth > 0:
+                self.depth -= 1
+                if self.depth == 0 and self.started:
+                    return True
+        return False
+
+@lru_cache(maxsize=8)
+def _get_http_client(base_url: str):
+    """Shared httpx pool per endpoint, sized so concurrent calls from _LLM_POOL
+    threads each get a warm keep-alive connection instead of queueing or re-handshaking."""
+    import httpx
+    # HTTP/2 multiplexes concurrent calls over one TLS connection to cloud endpoints;
+    # httpx only offers it when the optional h2 package is installed (plain-http Ollama stays on 1.1)
+    http2 = base_url.startswith("https://") and importlib.util.find_spec("h2") is not None
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=120.0),
+    )
+
+@lru_cache(maxsize=8)
+def _get_openai_client(base_url: str, api_key: str):
+    """Return a shared OpenAI client per (base_url, api_key) so every LLMClient
+    in the process reuses the same underlying httpx connection pool."""
+    import openai
+    return openai.OpenAI(base_url=base_url, api_key=api_key, http_client=_get_http_client(base_url))
+
+@lru_cache(maxsize=16)
+def _text_digest(text: str) -> str:
+    """Digest of a (large, repeated) prompt part, e.g. the per-run system message.
+    Memoized so each distinct text is hashed once rather than on every call."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+_warmed_clients: set = set()
+_warmed_lock = threading.Lock()
+
+def _prewarm_connections(*clients):
+    """Open a keep-alive connection to each distinct endpoint in the background
+    (GET /models) so the first planner call doesn't pay TCP/TLS setup. Best-effort."""
+    with _warmed_lock:
+        pending = [c for c in dict.fromkeys(clients) if id(c) not in _warmed_clients]
+        _warmed_clients.update(id(c) for c in pending)
+    for client in pending:
+        def _warm(c=client):
+            try:
+                c.with_options(timeout=10, max_retries=0).models.list()
+            except Exception:
+                pass
+        threading.Thread(target=_warm, name="aeon-llm-prewarm", daemon=True).start()
+
+class _GroupBatcher:
+    """Group-commit coalescing for concurrent calls from several threads.
+
+    A caller that finds no batch in flight runs immediately with whatever is queued
+    (a lone caller gets a batch of one, with no added latency). Callers that arrive
+    while a batch is running queue up and are served together by the next one.
+    `run_batch` maps a list of items to a same-length list of results, where an
+    Exception instance marks a per-item failure."""
+    def __init__(self, run_batch: Callable[[List], List], max_items: int = 4):
+        self.run_batch = run_batch
+        self.max_items = max_items
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[object, Future]] = []
+        self._running = False
+
+    def submit(self, item):
+        fut = Future()
+        with self._cond:
+            self._queue.append((item, fut))
+        while not fut.done():
+            with self._cond:
+                while self._running and not fut.done():
+                    self._cond.wait()
+                if fut.done():
+                    break
+                self._running = True
+                batch = self._queue[:self.max_items]
+                del self._queue[:self.max_items]
+            try:
+                results = self.run_batch([item for item, _ in batch])
+            except Exception as e:
+                results = [e] * len(batch)
+            for (_, f), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    f.set_exception(result)
+                else:
+                    f.set_result(result)
+            with self._cond:
+                self._running = False
+                self._cond.notify_all()
+        return fut.result()
+
+class _SemanticCache:
+    """Near-duplicate response cache: a hit needs the same kind, model and exact
+    context (the text being summarized, the working memory) plus a query whose
+    embedding has cosine similarity >= threshold with a cached one. Comparing only
+    queries keeps "Tell me about X" / "Summarize X" together without ever serving
+    an answer about different source text. Disabled when sentence-transformers
+    is not installed or its model fails to load."""
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", threshold: float = 0.87, max_entries: int = 512):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.enabled = SentenceTransformer is not None
+        self._embedder = None
+        self._lock = threading.Lock()
+        # (kind, model, context digest) -> list of [unit query vector, value]
+        self._entries: "OrderedDict[Tuple[str, str, str], List[list]]" = OrderedDict()
+        self._count = 0
+
+    def _embed(self, query: str):
+        with self._lock:
+            if self._embedder is None:
+                try:
+                    self._embedder = SentenceTransformer(self.model_name)
+                except Exception as e:
+                    get_logger().warning(f"Semantic cache disabled, embedder failed to load: {e}")
+                    self.enabled = False
+                    return None
+        return self._embedder.encode([query], normalize_embeddings=True)[0]
+
+    @staticmethod
+    def _group(kind: str, model: str, context: str) -> Tuple[str, str, str]:
+        return (kind, model, hashlib.blake2b(context.encode("utf-8"), digest_size=16).hexdigest())
+
+    def get(self, kind: str, model: str, context: str, query: str, threshold: Optional[float] = None):
+        """Return (value, query_vector). value is None on a miss; pass the vector to put().
+        `threshold` overrides the default similarity cut-off for this lookup."""
+        if not self.enabled:
+            return None, None
+        group = self._group(kind, model, context)
+        with self._lock:
+            candidates = list(self._entries.get(group, ()))
+        if not candidates:
+            return None, None
+        vec = self._embed(query)
+        if vec is None:
+            return None, None
+        best, best_sim = None, self.threshold if threshold is None else threshold
+        for cached_vec, value in candidates:
+            sim = float(cached_vec @ vec)
+            if sim >= best_sim:
+                best, best_sim = value, sim
+        if best is not None:
+            with self._lock:
+                if group in self._entries:
+                    self._entries.move_to_end(group)
+        return best, vec
+
+    def put(self, kind: str, model: str, context: str, query: str, value, vec=None):
+        if not self.enabled or not value:
+            return
+        if vec is None:
+            vec = self._embed(query)
+            if vec is None:
+                return
+        group = self._group(kind, model, context)
+        with self._lock:
+            self._entries.setdefault(group, []).append([vec, value])
+            self._entries.move_to_end(group)
+            self._count += 1
+            while self._count > self.max_entries:
+                _, dropped = self._entries.popitem(last=False)
+                self._count -= len(dropped)
 
 class LLMClient:
     """A client for interacting with Large Language Models (Cloud or Local)."""
@@ -26,17 +274,39 @@ class LLMClient:
         self.provider = provider
         self.logger = get_logger()
         self.debug_path: Optional[pathlib.Path] = None
+        self._debug_fh = None
+        self._debug_lock = threading.Lock()
+        self._debug_pending = 0
         self.current_iteration = 0
+        # Wall-clock cap on a single streamed completion (guards runaway generations)
+        self.max_stream_seconds = 600
+        # LRU (with TTL) of deterministic-enough helper calls and temperature-0 completions;
+        # values are (response, monotonic timestamp)
+        self._response_cache: "OrderedDict[Tuple[str, str, str], Tuple[object, float]]" = OrderedDict()
+        self._response_cache_size = 1024
+        self._response_cache_lock = threading.Lock()
+        # Cache misses already being computed; identical concurrent callers wait on these
+        self._inflight: Dict[Tuple[str, str, str], Future] = {}
+        self._disk_cache = None  # opened on first use of a _DISK_CACHE_TTLS kind
+        # Clients whose server rejected a json_schema response_format; they get json_object
+        self._schema_unsupported: set = set()
+        self._summarizer_endpoint: Optional[Tuple[str, str]] = None
+        # Concurrent summarize_execution calls (parallel research workers) share one request
+        self._execution_batcher = _GroupBatcher(self._summarize_execution_batch, max_items=4)
+        # Paraphrased repeats of summarize_text / think queries (needs sentence-transformers)
+        self._semantic_cache = _SemanticCache()
         
         # --- 1. LOCAL PROVIDER ---
         if provider == "local":
-            # Single Brain Node on Port 8000 handles both models
-            self.planner_client = openai.OpenAI(base_url="http://localhost:8000/v1", api_key="ollama")
+            # Single Brain Node handles both models unless AEON_EXECUTOR_URL splits them
+            self.planner_client = _get_openai_client(BRAIN.planner_url, "ollama")
             self.planner_model = local_strong or "deepseek-r1:70b"
-            self.executor_client = openai.OpenAI(base_url="http://localhost:8000/v1", api_key="ollama")
+            self.executor_client = _get_openai_client(BRAIN.executor_url, "ollama")
             self.executor_model = local_weak or "qwen2.5:72b"
             self.summarizer_client = self.executor_client
             self.summarizer_model = self.executor_model
+            # Local summaries skip the SDK and POST directly (see _raw_chat)
+            self._summarizer_endpoint = (BRAIN.executor_url, "ollama")
             self.context_limit = 128000 
         # --- 2. CLOUD PROVIDERS ---
         elif provider == "gemini":
@@ -46,107 +316,250 @@ class LLMClient:
             self.setup_cloud("grok-4-1-fast-reasoning", "grok-4-1-fast-non-reasoning", "grok_api_key.txt", "https://api.x.ai/v1")
             self.context_limit = 128000
 
+        _prewarm_connections(self.planner_client, self.executor_client, self.summarizer_client)
+
     def setup_cloud(self, strong, weak, key_file, url):
-        api_key_path = pathlib.Path.home() / key_file
-        if not api_key_path.exists():
-            raise FileNotFoundError(f"API key file not found: {api_key_path}")
-        with open(api_key_path, 'r') as f: 
-            api_key = f.readline().strip()
-        if not api_key:
-            raise ValueError(f"API key file is empty: {api_key_path}")
-        self.planner_client = openai.OpenAI(api_key=api_key, base_url=url)
+        api_key = read_api_key(key_file)
+        self.planner_client = _get_openai_client(url, api_key)
         self.executor_client = self.planner_client
         self.summarizer_client = self.planner_client
         self.planner_model = strong
         self.executor_model = strong
         self.summarizer_model = weak
 
+    # Buffered debug records are flushed every N writes (and on error records / exit)
+    _DEBUG_FLUSH_EVERY = 8
+
     def set_debug_path(self, path: pathlib.Path): 
-        self.debug_path = path
+        """Open the debug log once; records are appended through a buffered handle."""
+        with self._debug_lock:
+            self._close_debug_log_locked()
+            self.debug_path = path
+            try:
+                self._debug_fh = open(path, "a", encoding="utf-8", buffering=1 << 16)
+                atexit.register(self.close_debug_log)
+            except Exception as e:
+                self.logger.warning(f"Failed to open debug log: {e}")
+
+    def close_debug_log(self):
+        with self._debug_lock:
+            self._close_debug_log_locked()
+
+    def _close_debug_log_locked(self):
+        if self._debug_fh is not None:
+            try:
+                self._debug_fh.close()
+            except Exception:
+                pass
+            self._debug_fh = None
+            atexit.unregister(self.close_debug_log)
         
     def set_iteration(self, iteration: int): 
         self.current_iteration = iteration
 
     def _log_to_debug(self, m_type, m_name, prompt, resp):
-        if not self.debug_path: 
+        if self._debug_fh is None: 
             return
+        record = f"\n{'='*80}\nITER: {self.current_iteration} | {m_type} | {m_name}\n{'='*80}\nPROMPT:\n{prompt}\n{'-'*40}\nRESPONSE:\n{resp}\n"
+        with self._debug_lock:
+            if self._debug_fh is None:
+                return
+            try:
+                self._debug_fh.write(record)
+                self._debug_pending += 1
+                if self._debug_pending >= self._DEBUG_FLUSH_EVERY or m_type.endswith("ERR"):
+                    self._debug_fh.flush()
+                    self._debug_pending = 0
+            except Exception as e:
+                self.logger.warning(f"Failed to write to debug log: {e}")
+
+    def _create(self, client, model: str, messages, json_mode: bool = False, schema: Optional[Dict] = None, **kwargs) -> str:
+        """Chat completion as a string. Temperature-0 calls are deterministic, so
+        identical requests are answered from an exact-match cache (on disk when
+        diskcache is installed, otherwise in-process). `schema` (see schemas.py)
+        requests constrained JSON output where the server supports it."""
+        if kwargs.get("temperature", 1) > 0:
+            return self._stream_completion(client, model, messages, json_mode, schema, **kwargs)[0]
+        # The system message is the same for a whole run; key on its memoized digest
+        # so only the per-step user content is serialized and hashed each call
+        msgs = [{"role": m["role"], "content": _text_digest(m["content"])} if m["role"] == "system" else m
+                for m in messages]
+        payload = json_dumps_key({"m": model, "msg": msgs, "json": json_mode, "schema": schema, "kw": kwargs})
+        key = ("exact", model, hashlib.blake2b(payload, digest_size=16).hexdigest())
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        text, complete = self._stream_completion(client, model, messages, json_mode, schema, **kwargs)
+        if complete and text:
+            self._cache_put(key, text)
+        return text
+
+    def _raw_chat(self, base_url: str, api_key: str, model: str, messages, **sampling) -> str:
+        """Plain non-streamed POST to an OpenAI-compatible /chat/completions endpoint.
+        Used for local free-text summaries, which are on every tool output and need
+        none of the SDK's streaming, retries or response models."""
+        resp = _get_http_client(base_url).post(
+            f"{base_url.rstrip('/')}/chat/completions",
+            json={"model": model, "messages": messages, "stream": False, **sampling},
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=self.max_stream_seconds,
+        )
+        resp.raise_for_status()
+        return resp.json()["choices"][0]["message"].get("content") or ""
+
+    def _summarize(self, prompt: str) -> str:
+        messages = [{"role": "user", "content": prompt}]
+        if self._summarizer_endpoint:
+            return self._raw_chat(*self._summarizer_endpoint, self.summarizer_model, messages)
+        return self._create(self.summarizer_client, self.summarizer_model, messages)
+
+    def _get_disk_cache(self):
+        if diskcache is None:
+            return None
+        if self._disk_cache is None:
+            try:
+                self._disk_cache = diskcache.Cache(str(_EXACT_CACHE_DIR))
+            except Exception as e:
+                self.logger.warning(f"Disk LLM cache unavailable, using memory: {e}")
+                return None
+        return self._disk_cache
+
+    def _iter_deltas(self, client, model: str, messages, truncated: Optional[list] = None, **kwargs):
+        """Yield content deltas of a streamed completion as they arrive. The stream is
+        closed when the consumer stops iterating; hitting max_stream_seconds ends the
+        stream early and appends to `truncated` if given."""
+        stream = client.chat.completions.create(model=model, messages=messages, stream=True, **kwargs)
+        deadline = time.monotonic() + self.max_stream_seconds
         try:
-            with open(self.debug_path, "a", encoding="utf-8") as f:
-                f.write(f"\n{'='*80}\nITER: {self.current_iteration} | {m_type} | {m_name}\n{'='*80}\nPROMPT:\n{prompt}\n{'-'*40}\nRESPONSE:\n{resp}\n")
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                yield delta
+                if time.monotonic() > deadline:
+                    self.logger.warning(f"{model} stream exceeded {self.max_stream_seconds}s, truncating response.")
+                    if truncated is not None:
+                        truncated.append(True)
+                    return
+        finally:
+            stream.close()
+
+    def _stream_completion(self, client, model: str, messages, json_mode: bool = False,
+                           schema: Optional[Dict] = None, **kwargs) -> Tuple[str, bool]:
+        """Streamed chat completion, accumulated into a string.
+        For JSON calls the stream is closed as soon as the first top-level object
+        is complete, so trailing chatter is never waited for. The flag is False
+        if the response was cut off by max_stream_seconds. A server that rejects
+        the json_schema format is remembered and falls back to plain JSON mode."""
+        use_schema = json_mode and schema is not None and id(client) not in self._schema_unsupported
+        if use_schema:
+            kwargs["response_format"] = {"type": "json_schema", "json_schema": schema}
+        elif json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+        scanner = _JsonStreamScanner() if json_mode else None
+        truncated = []
+        parts = []
+        deltas = self._iter_deltas(client, model, messages, truncated=truncated, **kwargs)
+        try:
+            for delta in deltas:
+                parts.append(delta)
+                if scanner and scanner.feed(delta):
+                    break
         except Exception as e:
-            self.logger.warning(f"Failed to write to debug log: {e}")
+            if not use_schema or parts or getattr(e, "status_code", None) != 400:
+                raise
+            self.logger.warning(f"{model}: json_schema output rejected, falling back to json_object: {e}")
+            self._schema_unsupported.add(id(client))
+            return self._stream_completion(client, model, messages, json_mode, None, **kwargs)
+        finally:
+            deltas.close()
+        return "".join(parts), not truncated
+
+    def _parse_json_response(self, raw: str) -> Tuple[str, object]:
+        """Return (json_text, parsed). Schema-constrained output usually parses as-is,
+        so the cleanup scan only runs when it doesn't."""
+        try:
+            parsed = _json_loads(raw)
+            if isinstance(parsed, dict):
+                return raw, parsed
+        except ValueError:
+            pass
+        cleaned = self._clean_json_response(raw)
+        return cleaned, _json_loads(cleaned)
 
     def _clean_json_response(self, content: str) -> str:
         """Clean LLM response to extract JSON, handling common LLM formatting quirks."""
         if not content:
             return "{}"
         
-        # Remove <think> tags and their content (including orphaned closing tags)
-        content = re.sub(r'<think>.*?</think>', '', content, flags=re.DOTALL)
-        content = re.sub(r'</think>', '', content)
-        content = re.sub(r'<think>', '', content)
-        
-        # Remove markdown code fences
-        content = re.sub(r'```json\s*', '', content)
-        content = re.sub(r'```\s*', '', content)
+        # Work on index bounds instead of sliced copies. Reasoning is dropped with plain
+        # string searches: everything up to the last </think> (covers several blocks and
+        # templates that omit the opening tag), and anything after an unclosed <think> -
+        # a truncated reasoning block holds no answer.
+        lo = content.rfind('</think>')
+        lo = lo + len('</think>') if lo != -1 else 0
+        hi = content.find('<think>', lo)
+        if hi == -1:
+            hi = len(content)
         
-        content = content.strip()
-        
-        # Use brace matching to find the first complete JSON object
-        # This handles text before/after the JSON
-        brace_count = 0
-        json_start = -1
-        json_end = -1
-        in_string = False
-        escape_next = False
-        
-        for i, char in enumerate(content):
-            if escape_next:
-                escape_next = False
-                continue
-            if char == '\\':
-                escape_next = True
-                continue
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-            if char == '{':
-                if json_start == -1:
-                    json_start = i
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0 and json_start != -1:
-                    json_end = i + 1
-                    break
-        
-        if json_start != -1 and json_end != -1:
-            return content[json_start:json_end]
-        
-        # Fallback: try simple regex
-        match = re.search(r'\{.*\}', content, re.DOTALL)
-        if match:
-            return match.group(0)
+        # Single pass from the first '{' to its matching '}', tracking string/escape
+        # state so braces inside values don't count. Text and markdown fences around
+        # the JSON are skipped; fences inside string values are left intact.
+        json_start = content.find('{', lo, hi)
+        if json_start != -1:
+            depth = 0
+            in_string = False
+            escaped_pos = -1
+            for match in _JSON_TOKEN_RE.finditer(content, json_start, hi):
+                i = match.start()
+                if i == escaped_pos:
+                    continue
+                char = match.group()
+                if char == '\\':
+                    escaped_pos = i + 1
+                elif char == '"':
+                    in_string = not in_string
+                elif in_string:
+                    continue
+                elif char == '{':
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return content[json_start:i + 1]
+            
+            # Unbalanced (e.g. truncated): fall back to first '{' .. last '}'
+            json_end = content.rfind('}', json_start, hi)
+            if json_end > json_start:
+                return content[json_start:json_end + 1]
         
+        content = content[lo:hi].strip()
         self.logger.warning(f"No JSON object found in response: {content[:200]}...")
         return "{}"
 
-    def get_plan(self, prompt: str, max_retries: int = 3) -> str:
-        """Get plan from planner LLM with retry logic for JSON parsing errors."""
+    @staticmethod
+    def _messages(prompt: str, system: Optional[str] = None) -> List[Dict[str, str]]:
+        """Chat messages for a prompt; the stable `system` part goes first in its own message."""
+        if system:
+            return [{"role": "system", "content": system}, {"role": "user", "content": prompt}]
+        return [{"role": "user", "content": prompt}]
+
+    def get_plan(self, prompt: str, max_retries: int = 3, schema: Dict = PLAN_SCHEMA,
+                 system: Optional[str] = None) -> str:
+        """Get plan from planner LLM with retry logic for JSON parsing errors.
+        `system` is the per-toolset context (directives, tools), sent as the system message."""
         current_prompt = prompt
         last_error = None
         
         for attempt in range(max_retries):
             try:
-                resp = self.planner_client.chat.completions.create(
-                    model=self.planner_model, 
-                    messages=[{"role": "user", "content": current_prompt}], 
-                    temperature=0.3,
-                    response_format={"type": "json_object"}
+                raw = self._create(
+                    self.planner_client, self.planner_model,
+                    self._messages(current_prompt, system),
+                    json_mode=True, schema=schema, temperature=0.3
                 )
-                raw = resp.choices[0].message.content
                 
                 # DEBUG PRINT TO CONSOLE
                 if self.debug_path:
@@ -154,11 +567,9 @@ class LLMClient:
                 
                 self._log_to_debug("PLANNER", self.planner_model, current_prompt, raw)
                 
-                cleaned = self._clean_json_response(raw)
-                
                 # Validate JSON parsing
                 try:
-                    parsed = json.loads(cleaned)
+                    cleaned, parsed = self._parse_json_response(raw)
                     if not parsed:
                         raise ValueError("Empty JSON object returned.")
                     return cleaned
@@ -168,7 +579,7 @@ class LLMClient:
                     
                     if attempt < max_retries - 1:
                         # Add error feedback to prompt for retry
-                        current_prompt = prompt + f"\n\n** RETRY - YOUR PREVIOUS RESPONSE WAS INVALID **\nError: {last_error}\nRaw output started with: {raw[:300]}...\n\nYou MUST output ONLY a valid, non-empty JSON object. No text before {{ or after }}. Use double quotes only."
+                        current_prompt = prompt + _RETRY_SUFFIX.format(error=last_error, raw_start=raw[:300])
                     
             except Exception as e:
                 self._log_to_debug("PLANNER_ERR", self.planner_model, current_prompt, str(e))
@@ -180,32 +591,35 @@ class LLMClient:
         self.logger.error(error_msg)
         raise RuntimeError(error_msg)
 
-    def get_action(self, prompt: str, max_retries: int = 3) -> str:
-        """Get action from executor LLM with retry logic for JSON parsing errors."""
+    def get_action(self, prompt: str, max_retries: int = 3, prefer_weak: bool = False,
+                   system: Optional[str] = None) -> str:
+        """Get action from executor LLM with retry logic for JSON parsing errors.
+
+        prefer_weak routes the call to the summarizer (weak) model when it differs
+        from the executor; any invalid response escalates the retry to the executor."""
         current_prompt = prompt
         last_error = None
+        client, model = self.executor_client, self.executor_model
+        if prefer_weak and self.summarizer_model != self.executor_model:
+            client, model = self.summarizer_client, self.summarizer_model
         
         for attempt in range(max_retries):
             try:
-                resp = self.executor_client.chat.completions.create(
-                    model=self.executor_model, 
-                    messages=[{"role": "user", "content": current_prompt}], 
-                    temperature=0.1,
-                    response_format={"type": "json_object"}
+                raw = self._create(
+                    client, model,
+                    self._messages(current_prompt, system),
+                    json_mode=True, schema=ACTION_SCHEMA, temperature=0.1
                 )
-                raw = resp.choices[0].message.content
                 
                 # DEBUG PRINT TO CONSOLE
                 if self.debug_path:
                     print(f"{C_YELLOW}[LLM RAW - EXECUTOR]\n{raw}{C_RESET}")
                 
-                self._log_to_debug("EXECUTOR", self.executor_model, current_prompt, raw)
-                
-                cleaned = self._clean_json_response(raw)
+                self._log_to_debug("EXECUTOR", model, current_prompt, raw)
                 
                 # Validate JSON parsing
                 try:
-                    parsed = json.loads(cleaned)
+                    cleaned, parsed = self._parse_json_response(raw)
                     # Executor MUST return actions
                     if not parsed:
                         raise ValueError("Empty JSON object returned.")
@@ -216,13 +630,14 @@ class LLMClient:
                 except (json.JSONDecodeError, ValueError) as e:
                     last_error = f"JSON validation error: {str(e)}"
                     self.logger.warning(f"Executor attempt {attempt + 1}/{max_retries} failed: {last_error}")
+                    client, model = self.executor_client, self.executor_model
                     
                     if attempt < max_retries - 1:
                         # Add error feedback to prompt for retry
-                        current_prompt = prompt + f"\n\n** RETRY - YOUR PREVIOUS RESPONSE WAS INVALID **\nError: {last_error}\nRaw output started with: {raw[:300]}...\n\nYou MUST output ONLY a valid, non-empty JSON object. No text before {{ or after }}. Use double quotes only."
+                        current_prompt = prompt + _RETRY_SUFFIX.format(error=last_error, raw_start=raw[:300])
                     
             except Exception as e:
-                self._log_to_debug("EXEC_ERR", self.executor_model, current_prompt, str(e))
+                self._log_to_debug("EXEC_ERR", model, current_prompt, str(e))
                 self.logger.error(f"Executor LLM call failed: {e}")
                 raise
         
@@ -231,23 +646,90 @@ class LLMClient:
         self.logger.error(error_msg)
         raise RuntimeError(error_msg)
 
+    def submit_action(self, prompt: str, prefer_weak: bool = False, system: Optional[str] = None) -> Future:
+        """Start get_action on the shared LLM pool and return its future (for speculative calls)."""
+        return _LLM_POOL.submit(self.get_action, prompt, prefer_weak=prefer_weak, system=system)
+
+    def plan_and_act(self, plan_prompt: str, system: Optional[str] = None) -> Tuple[str, Optional[str]]:
+        """Plan and write the first executor response in a single request.
+
+        Only when planner and executor are the same model on the same endpoint;
+        otherwise this is get_plan alone. Returns (plan_json, action_json) where
+        action_json is None if the model left the actions to the executor or
+        returned none usable."""
+        if self.planner_model != self.executor_model or self.planner_client is not self.executor_client:
+            return self.get_plan(prompt=plan_prompt, system=system), None
+        raw = self.get_plan(prompt=f"{plan_prompt}\n\n{PLAN_AND_ACTION_INSTRUCTIONS}", schema=PLAN_AND_ACTION_SCHEMA, system=system)
+        parsed = _json_loads(raw)
+        action = parsed.pop("action", None)
+        actions = action.get("actions") if isinstance(action, dict) else None
+        if not (isinstance(actions, list) and actions
+                and all(isinstance(a, dict) and a.get("tool_name") for a in actions)):
+            return json_dumps(parsed), None
+        return json_dumps(parsed), json_dumps(action)
+
+    def get_plan_and_action(self, plan_prompt: str, action_prompt: Optional[str] = None,
+                            system: Optional[str] = None) -> Tuple[str, Optional[str]]:
+        """Run the planner and, if given, a speculative executor call concurrently.
+        Returns (plan_json, action_json). The action is None if it was not requested
+        or failed - speculation must never break the planner path."""
+        if not action_prompt:
+            return self.get_plan(prompt=plan_prompt, system=system), None
+        action_future = _LLM_POOL.submit(self.get_action, action_prompt, system=system)
+        try:
+            plan = self.get_plan(prompt=plan_prompt, system=system)
+        except Exception:
+            action_future.cancel()
+            raise
+        try:
+            action = action_future.result()
+        except Exception as e:
+            self.logger.warning(f"Speculative executor call failed: {e}")
+            action = None
+        return plan, action
+
+    # --- Awaitable wrappers ---
+    # The client is synchronous; these run the blocking call on _LLM_POOL so an
+    # asyncio (or GUI) caller's event loop keeps running while the model generates.
+
+    async def _run_in_pool(self, fn, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(_LLM_POOL, partial(fn, *args, **kwargs))
+
+    async def aget_plan(self, prompt: str, max_retries: int = 3, system: Optional[str] = None) -> str:
+        return await self._run_in_pool(self.get_plan, prompt, max_retries=max_retries, system=system)
+
+    async def aget_action(self, prompt: str, max_retries: int = 3, prefer_weak: bool = False,
+                          system: Optional[str] = None) -> str:
+        return await self._run_in_pool(self.get_action, prompt, max_retries=max_retries,
+                                       prefer_weak=prefer_weak, system=system)
+
+    async def asummarize_execution(self, ctx, raw_out) -> str:
+        return await self._run_in_pool(self.summarize_execution, ctx, raw_out)
+
+    async def asummarize_text(self, text: str, query: str) -> str:
+        return await self._run_in_pool(self.summarize_text, text, query)
+
+    async def aanalyze_interruption(self, obj, inp) -> Dict:
+        return await self._run_in_pool(self.analyze_interruption, obj, inp)
+
+    async def areason(self, prompt: str) -> str:
+        return await self._run_in_pool(self.reason, prompt)
+
     def analyze_milestones(self, analysis_context: str) -> Dict:
         """Analyze iteration results to identify completed milestones.
         Uses the summarizer model (weaker/faster) since this is a lightweight analysis task.
         """
         try:
-            resp = self.summarizer_client.chat.completions.create(
-                model=self.summarizer_model,
-                messages=[{"role": "user", "content": analysis_context}],
-                temperature=0.1,
-                response_format={"type": "json_object"}
+            raw = self._create(
+                self.summarizer_client, self.summarizer_model,
+                [{"role": "user", "content": analysis_context}],
+                json_mode=True, temperature=0.1
             )
-            raw = resp.choices[0].message.content
             self._log_to_debug("MILESTONE_ANALYZER", self.summarizer_model, analysis_context, raw)
             
             # Parse JSON response
             clean_json = self._clean_json_response(raw)
-            return json.loads(clean_json)
+            return _json_loads(clean_json)
         except json.JSONDecodeError as e:
             self._log_to_debug("MILESTONE_PARSE_ERR", self.summarizer_model, analysis_context, str(e))
             self.logger.warning(f"Failed to parse milestone analysis JSON: {e}")
@@ -270,12 +752,11 @@ class LLMClient:
         safe_out = self._truncate_with_tail(raw_out, head_len=4000, tail_len=16000)
         
         prompt = SUMMARIZE_EXECUTION_PROMPT.format(ctx=ctx, safe_out=safe_out)
+        key = self._cache_key("execution", self.summarizer_model, prompt)
+        # Exact-match only: ctx just names the chain's tools, which the output already
+        # spells out, so a near-duplicate ctx adds nothing the exact key doesn't cover
         try:
-            resp = self.summarizer_client.chat.completions.create(
-                model=self.summarizer_model, 
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return resp.choices[0].message.content
+            return self._cached_call(key, lambda: self._execution_batcher.submit((ctx, safe_out, prompt)))
         except Exception as e:
             self.logger.warning(f"Summarize execution failed: {e}")
             # LOUD FAILURE: Explicitly report the crash to the agent
@@ -285,41 +766,161 @@ class LLMClient:
                     f"Output Length: {len(raw_out)}\n"
                     f"--- RAW TAIL (Last 1000 chars) ---\n{tail_sample}")
 
+    def _summarize_execution_batch(self, items: List[Tuple[str, str, str]]) -> List:
+        """Summarize several (ctx, safe_out, prompt) items, in one request when there is more than one."""
+        if len(items) > 1:
+            body = "\n\n".join(f"### Item {i}\nContext: {ctx}\nOutput: {out}" for i, (ctx, out, _) in enumerate(items, 1))
+            prompt = SUMMARIZE_EXECUTION_BATCH_PROMPT.format(count=len(items), items=body)
+            try:
+                raw = self._create(self.summarizer_client, self.summarizer_model, [{"role": "user", "content": prompt}], json_mode=True)
+                summaries = _json_loads(self._clean_json_response(raw)).get("summaries")
+                if isinstance(summaries, list) and len(summaries) == len(items) and all(isinstance(x, str) and x.strip() for x in summaries):
+                    return summaries
+                self.logger.warning(f"Batched summary returned a malformed list for {len(items)} items, summarizing individually.")
+            except Exception as e:
+                self.logger.warning(f"Batched summary failed ({e}), summarizing individually.")
+        results = []
+        for _, _, prompt in items:
+            try:
+                results.append(self._summarize(prompt))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _cache_key(self, kind: str, model: str, prompt: str) -> Tuple[str, str, str]:
+        # Scraped pages are whitespace-insensitive so re-wrapped duplicates still hit; other
+        # kinds hash the exact prompt, since whitespace matters in tracebacks, diffs and YAML
+        if kind == "summary":
+            prompt = _WHITESPACE_RE.sub(' ', prompt).strip()
+        return (kind, model, hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest())
+
+    def _cache_get(self, key):
+        """Memory first, then disk for the kinds in _DISK_CACHE_TTLS. Disk errors count as a miss."""
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None:
+                if time.monotonic() - entry[1] <= _RESPONSE_CACHE_TTL:
+                    self._response_cache.move_to_end(key)
+                    return entry[0]
+                del self._response_cache[key]
+        disk = self._get_disk_cache() if key[0] in _DISK_CACHE_TTLS else None
+        if disk is None:
+            return None
+        try:
+            value = disk.get(":".join(key))
+        except Exception as e:
+            self.logger.warning(f"Disk LLM cache read failed: {e}")
+            return None
+        if value is not None:
+            self._memory_put(key, value)
+        return value
+
+    def _cache_put(self, key, value):
+        self._memory_put(key, value)
+        ttl = _DISK_CACHE_TTLS.get(key[0])
+        disk = self._get_disk_cache() if ttl else None
+        if disk is not None:
+            try:
+                disk.set(":".join(key), value, expire=ttl)
+            except Exception as e:
+                self.logger.warning(f"Disk LLM cache write failed: {e}")
+
+    def _memory_put(self, key, value):
+        with self._response_cache_lock:
+            self._response_cache[key] = (value, time.monotonic())
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self._response_cache_size:
+                self._response_cache.popitem(last=False)
+
+    def _single_flight(self, key, compute: Callable[[], object]):
+        """Run compute() for `key` once even if several threads miss the cache together;
+        the others block on the leader's Future and get its result (or exception)."""
+        with self._response_cache_lock:
+            fut = self._inflight.get(key)
+            leader = fut is None
+            if leader:
+                fut = self._inflight[key] = Future()
+        if not leader:
+            return fut.result()
+        try:
+            fut.set_result(compute())
+        except BaseException as e:
+            fut.set_exception(e)
+        finally:
+            with self._response_cache_lock:
+                self._inflight.pop(key, None)
+        return fut.result()
+
+    def _cached_call(self, key, compute: Callable[[], object]):
+        """Response-cache lookup, falling back to a single-flight compute that fills the cache."""
+        def _fill():
+            value = compute()
+            self._cache_put(key, value)
+            return value
+        cached = self._cache_get(key)
+        return cached if cached is not None else self._single_flight(key, _fill)
+
     def analyze_interruption(self, obj, inp) -> Dict:
-        """Analyze user interruption to classify intent."""
+        """Analyze user interruption to classify intent.
+        A three-way classification, so it runs on the summarizer (weak) model."""
         prompt = ANALYZE_INTERRUPTION_PROMPT.format(obj=obj, inp=inp)
+        key = self._cache_key("interruption", self.summarizer_model, prompt)
+        # Exact-match only: the result carries updated_text, so a near-duplicate reply
+        # ("switch to the parser for X" vs "... for Y") must never reuse it
+        def _compute():
+            # Classification: run deterministically so repeats hit the exact-match cache
+            raw = self._create(self.summarizer_client, self.summarizer_model, [{"role": "user", "content": prompt}],
+                               json_mode=True, schema=INTERRUPTION_SCHEMA, temperature=0)
+            return self._parse_json_response(raw)[1]
         try:
-            resp = self.executor_client.chat.completions.create(
-                model=self.executor_model, 
-                messages=[{"role": "user", "content": prompt}], 
-                response_format={"type": "json_object"}
-            )
-            return json.loads(resp.choices[0].message.content)
+            return dict(self._cached_call(key, _compute))
         except Exception as e:
             self.logger.warning(f"Interruption analysis failed: {e}")
             return {"classification": "ADVICE", "updated_text": inp, "reasoning": "Failed to analyze"}
 
-    def reason(self, prompt: str) -> str:
-        """General reasoning/thinking call."""
+    def reason_stream(self, prompt: str):
+        """General reasoning/thinking call, yielding text as the model produces it."""
         try:
-            resp = self.planner_client.chat.completions.create(
-                model=self.planner_model, 
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return resp.choices[0].message.content
+            yield from self._iter_deltas(self.planner_client, self.planner_model, [{"role": "user", "content": prompt}])
+        except Exception as e:
+            self.logger.error(f"Reason call failed: {e}")
+            yield f"Error during reasoning: {e}"
+
+    def reason(self, prompt: str, semantic_key: Optional[Tuple[str, str]] = None) -> str:
+        """General reasoning/thinking call.
+
+        semantic_key=(context, query) lets a paraphrase of an earlier query over
+        the same context reuse its answer (see _SemanticCache)."""
+        if semantic_key is None:
+            return "".join(self.reason_stream(prompt))
+        context, query = semantic_key
+        # Think queries are short one-liners: "why does test_a fail" must not answer test_b
+        cached, vec = self._semantic_cache.get("reason", self.planner_model, context, query,
+                                               threshold=_STRICT_SIMILARITY)
+        if cached is not None:
+            return cached
+        try:
+            text = "".join(self._iter_deltas(self.planner_client, self.planner_model, [{"role": "user", "content": prompt}]))
         except Exception as e:
             self.logger.error(f"Reason call failed: {e}")
             return f"Error during reasoning: {e}"
+        self._semantic_cache.put("reason", self.planner_model, context, query, text, vec)
+        return text
 
     def summarize_text(self, text: str, query: str) -> str:
         """Summarize text in context of a query."""
         prompt = SUMMARIZE_TEXT_PROMPT.format(query=query, text=text)
+        key = self._cache_key("summary", self.summarizer_model, prompt)
+        def _compute():
+            cached, vec = self._semantic_cache.get("summary", self.summarizer_model, text, query,
+                                                   threshold=_STRICT_SIMILARITY)
+            if cached is not None:
+                return cached
+            summary = self._summarize(prompt)
+            self._semantic_cache.put("summary", self.summarizer_model, text, query, summary, vec)
+            return summary
         try:
-            resp = self.summarizer_client.chat.completions.create(
-                model=self.summarizer_model, 
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return resp.choices[0].message.content
+            return self._cached_call(key, _compute)
         except Exception as e:
             self.logger.warning(f"Summarize text failed: {e}")
             return f"Failed to summarize: {e}"
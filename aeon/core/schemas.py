@@ -0,0 +1,70 @@
+"""
+JSON schemas for the structured LLM responses (plan, action, interruption).
+Passed as OpenAI-style `response_format={"type": "json_schema", ...}` so servers that
+support constrained decoding only emit valid JSON. Non-strict: the worker tolerates
+extra keys and tool parameters are free-form objects.
+"""
+
+PLAN_SCHEMA = {
+    "name": "plan",
+    "strict": False,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "analysis": {"type": "string"},
+            "updated_plan": {"type": "string"},
+            "next_actions": {"type": ["string", "array"]},
+            "iteration_strategy": {"type": "string"},
+            "risk_notes": {"type": "string"},
+        },
+        "required": ["analysis", "updated_plan", "next_actions"],
+    },
+}
+
+ACTION_SCHEMA = {
+    "name": "action",
+    "strict": False,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "actions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "tool_name": {"type": "string"},
+                        "parameters": {"type": "object"},
+                        "allow_failure": {"type": "boolean"},
+                        "parallel_group": {"type": "integer"},
+                    },
+                    "required": ["tool_name", "parameters"],
+                },
+            },
+        },
+        "required": ["actions"],
+    },
+}
+
+INTERRUPTION_SCHEMA = {
+    "name": "interruption",
+    "strict": False,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "classification": {"type": "string", "enum": ["NEW_TASK", "MODIFY_OBJECTIVE", "ADVICE"]},
+            "updated_text": {"type": "string"},
+            "reasoning": {"type": "string"},
+        },
+        "required": ["classification", "updated_text", "reasoning"],
+    },
+}
+
+# Planner fields plus an optional executor response, for LLMClient.plan_and_act
+PLAN_AND_ACTION_SCHEMA = {
+    "name": "plan_and_action",
+    "strict": False,
+    "schema": {
+        **PLAN_SCHEMA["schema"],
+        "properties": {**PLAN_SCHEMA["schema"]["properties"], "action": ACTION_SCHEMA["schema"]},
+    },
+}
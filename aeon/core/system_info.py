@@ -1,38 +1,46 @@
 import psutil
 import os
 import time
+from functools import lru_cache
 
 MAX_TREE_TOKENS = 100000 
 CHARS_PER_TOKEN = 4
 MAX_OUTPUT_CHARS = MAX_TREE_TOKENS * CHARS_PER_TOKEN
 
 def get_directory_tree_str(startpath='.', strict_file_limit=None, strict_dir_limit=None):
-    all_files_stats = []
+    # One walk collects the listing and every file's stat; the render below reuses
+    # both instead of walking and stat'ing the tree a second time.
+    listing = {}
+    file_stats = {}
     for root, dirs, files in os.walk(startpath):
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
-        files = [f for f in files if not f.startswith('.')]
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d != '__pycache__')
+        files = sorted(f for f in files if not f.startswith('.'))
+        listing[root] = (list(dirs), files)
         for f in files:
             fp = os.path.join(root, f)
             try:
-                st = os.stat(fp)
-                all_files_stats.append({'path': fp, 'size': st.st_size, 'mtime': st.st_mtime})
+                file_stats[fp] = os.stat(fp)
             except OSError as e:
                 # Log but continue - file may have been deleted during walk
                 pass
             
-    all_files_stats.sort(key=lambda x: x['mtime'], reverse=True)
-    top_10_recent_paths = set(x['path'] for x in all_files_stats[:10])
+    recent = sorted(file_stats, key=lambda fp: file_stats[fp].st_mtime, reverse=True)
+    top_10_recent_paths = set(recent[:10])
     
     now = time.time()
     tree_lines = []
     tree_lines.append(f"ref_time: {int(now)} | units: MB | timestamps: top 10 most recent (seconds from ref)")
     
-    for root, dirs, files in os.walk(startpath, topdown=True):
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
-        files = [f for f in files if not f.startswith('.')]
-        dirs.sort(); files.sort()
+    # Pre-order, same as the os.walk(topdown=True) order it replaces
+    stack = [startpath]
+    while stack:
+        root = stack.pop()
+        if root not in listing:
+            continue
+        dirs, files = listing[root]
         if strict_dir_limit is not None and len(dirs) > strict_dir_limit: 
-            dirs[:] = dirs[:strict_dir_limit]
+            dirs = dirs[:strict_dir_limit]
+        stack.extend(os.path.join(root, d) for d in reversed(dirs))
         
         level = root.replace(startpath, '').count(os.sep)
         indent = ' ' * 4 * level
@@ -47,41 +55,69 @@ def get_directory_tree_str(startpath='.', strict_file_limit=None, strict_dir_lim
             
         for f in files_to_display:
             full_path = os.path.join(root, f)
-            try:
-                stat = os.stat(full_path)
-                size_mb = stat.st_size / (1024 * 1024)
-                # Use compact format: show decimal only if < 10MB
-                if size_mb < 0.01:
-                    meta = "<0.01"
-                elif size_mb < 10:
-                    meta = f"{size_mb:.2f}"
-                else:
-                    meta = f"{size_mb:.1f}"
-                if full_path in top_10_recent_paths:
-                    meta += f", {int(stat.st_mtime - now)}"
-                tree_lines.append(f'{sub_indent}{f} ({meta})')
-            except OSError:
+            stat = file_stats.get(full_path)
+            if stat is None:
                 tree_lines.append(f'{sub_indent}{f} (?)')
+                continue
+            size_mb = stat.st_size / (1024 * 1024)
+            # Use compact format: show decimal only if < 10MB
+            if size_mb < 0.01:
+                meta = "<0.01"
+            elif size_mb < 10:
+                meta = f"{size_mb:.2f}"
+            else:
+                meta = f"{size_mb:.1f}"
+            if full_path in top_10_recent_paths:
+                meta += f", {int(stat.st_mtime - now)}"
+            tree_lines.append(f'{sub_indent}{f} ({meta})')
     return "\n".join(tree_lines)
 
-def get_runtime_info():
-    cpu_percent = psutil.cpu_percent(interval=0.1)
+# Host stats are refreshed at most this often (an agent step usually takes longer than
+# a few seconds, so a short TTL would never hit); the project tree is always rebuilt
+RUNTIME_STATS_TTL = 60.0
+_stats_cache = (float('-inf'), "")
+
+@lru_cache(maxsize=1)
+def _nvml():
+    """Initialise NVML once and return (module, device count), or an error label."""
+    try:
+        import pynvml
+        pynvml.nvmlInit()
+        return pynvml, pynvml.nvmlDeviceGetCount()
+    except ImportError:
+        return "gpu: n/a (pynvml not installed)"
+    except Exception:
+        return "gpu: n/a"
+
+def _runtime_stats():
+    global _stats_cache
+    ts, value = _stats_cache
+    if time.monotonic() - ts < RUNTIME_STATS_TTL:
+        return value
+    # interval=None: utilisation since the previous call, without blocking for a sample window
+    cpu_percent = psutil.cpu_percent(interval=None)
     svmem = psutil.virtual_memory()
     parts = [f"cpu: {cpu_percent}%", f"mem: {svmem.percent}% ({svmem.available/(1024**3):.1f}gb free)"]
-    try:
-        from pynvml import nvmlInit, nvmlDeviceGetCount, nvmlDeviceGetHandleByIndex, nvmlDeviceGetUtilizationRates, nvmlDeviceGetMemoryInfo, NVMLError
-        nvmlInit()
-        for i in range(nvmlDeviceGetCount()):
+    nvml = _nvml()
+    if isinstance(nvml, str):
+        parts.append(nvml)
+    else:
+        pynvml, count = nvml
+        for i in range(count):
             try:
-                handle = nvmlDeviceGetHandleByIndex(i)
-                util = nvmlDeviceGetUtilizationRates(handle)
-                mem = nvmlDeviceGetMemoryInfo(handle)
+                handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+                util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
                 parts.append(f"gpu{i}: {util.gpu}% ({mem.free/(1024**3):.1f}gb free)")
             except Exception:
                 parts.append(f"gpu{i}: n/a")
-    except ImportError:
-        parts.append("gpu: n/a (pynvml not installed)")
-    except Exception:
-        parts.append("gpu: n/a")
+    value = ' | '.join(parts)
+    _stats_cache = (time.monotonic(), value)
+    return value
+
+# Prime the counter so the first non-blocking cpu_percent() reading is meaningful
+psutil.cpu_percent(interval=None)
+
+def get_runtime_info():
     dir_tree = get_directory_tree_str('.')
-    return f"**stats:** {' | '.join(parts)}\n\n**project tree**\n{dir_tree}"
+    return f"**stats:** {_runtime_stats()}\n\n**project tree**\n{dir_tree}"
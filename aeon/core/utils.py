@@ -1,11 +1,88 @@
-import tiktoken
-from typing import Optional
+import json
+import pathlib
+import sys
+from functools import lru_cache
+from typing import Any, Optional
 
-def estimate_tokens(text: str) -> int:
-    """Estimate token count for text using tiktoken (cl100k_base encoding) with fallback."""
+try:
+    # Optional: orjson is several times faster; its errors subclass json.JSONDecodeError
+    import orjson
+except ImportError:
+    orjson = None
+
+# Whether to emit ANSI colors: off when stdout is piped or logged, so output stays free of escape codes
+STDOUT_IS_TTY = sys.stdout.isatty()
+
+def json_loads(text):
+    """Parse JSON (str or bytes) with orjson when available."""
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+def json_dumps(obj: Any) -> str:
+    """Compact JSON text, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+def json_dumps_key(obj: Any) -> bytes:
+    """Canonical (sorted-key) JSON bytes for hashing into cache keys. Unknown types use str()."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, default=str).encode('utf-8')
+
+@lru_cache(maxsize=1)
+def _get_encoder():
+    """Load the cl100k_base encoder once per process (construction is the slow part).
+    Returns None if tiktoken or its encoding files are unavailable, so a failed
+    load is also only attempted once."""
     try:
-        encoder = tiktoken.get_encoding('cl100k_base')
-        return len(encoder.encode(text))
-    except (ImportError, Exception):
+        import tiktoken
+        return tiktoken.get_encoding('cl100k_base')
+    except Exception:
+        return None
+
+def estimate_tokens(text: str, limit: Optional[int] = None) -> int:
+    """Estimate token count for text using tiktoken (cl100k_base encoding) with fallback.
+
+    If `limit` is given and the cheap chars/4 estimate is under half of it, that
+    estimate is returned without tokenizing - exact counts only matter near the limit.
+    """
+    approx = len(text) // 4 + 1
+    if limit is not None and approx < limit // 2:
+        return approx
+    encoder = _get_encoder()
+    if encoder is None:
         # Fallback to approximate estimation if tiktoken unavailable
-        return len(text) // 4 + 1
+        return approx
+    return len(encoder.encode(text))
+
+def truncate_to_tokens(text: str, max_tokens: int, head_frac: float = 0.4) -> str:
+    """Keep the head and tail of `text` within roughly `max_tokens`, marking the cut.
+    The tail gets the larger share since errors and recent output sit at the end."""
+    if estimate_tokens(text, limit=max_tokens) <= max_tokens:
+        return text
+    max_chars = max_tokens * 4
+    head_chars = int(max_chars * head_frac)
+    tail_chars = max_chars - head_chars
+    omitted = len(text) - head_chars - tail_chars
+    if omitted <= 0:
+        return text
+    return f"{text[:head_chars]}\n... [TRUNCATED {omitted} CHARS] ...\n{text[-tail_chars:]}"
+
+@lru_cache(maxsize=4)
+def _load_api_key(path: str, mtime_ns: int) -> str:
+    """Read the first line of a key file; mtime_ns is part of the cache key so a rotated key is re-read."""
+    with open(path, 'r') as f:
+        api_key = f.readline().strip()
+    if not api_key:
+        raise ValueError(f"API key file is empty: {path}")
+    return api_key
+
+def read_api_key(key_file: str) -> str:
+    """Return the key in ~/<key_file>, hitting the disk only when the file changed.
+    Raises FileNotFoundError if the file is missing and ValueError if it is empty."""
+    api_key_path = pathlib.Path.home() / key_file
+    try:
+        mtime_ns = api_key_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"API key file not found: {api_key_path}") from None
+    return _load_api_key(str(api_key_path), mtime_ns)
@@ -1,42 +1,91 @@
 import json
 import re
-import time
-import sys
+import hashlib
+import threading
 import os
 from datetime import datetime
-from collections import deque
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Any, Dict, Callable, Optional
+from typing import List, Any, Dict, Callable, Optional, Tuple
 
 from .llm import LLMClient
+from ..tools.base import SummarizePolicy
 from .system_info import get_runtime_info
 from .logger import get_logger
+from .utils import STDOUT_IS_TTY, estimate_tokens, json_loads, truncate_to_tokens
 from .prompts import (
     CORE_DIRECTIVES,
     DOCKER_DIRECTIVES,
+    DIRECTIVES_BLOCK,
     IMPORTANT_REMINDERS,
     PLANNER_INSTRUCTIONS,
     EXECUTOR_INSTRUCTIONS,
     PREFLIGHT_INSTRUCTIONS,
     MILESTONE_ANALYZER_INSTRUCTIONS,
+    PARALLEL_TOOLS_NOTE,
 )
 
-# Colors for terminal output
-C_RED = '\033[91m'
-C_YELLOW = '\033[93m'
-C_CYAN = '\033[96m'
-C_GREEN = '\033[92m'
-C_RESET = '\033[0m'
-C_BLUE = '\033[94m'
+# Colors for terminal output; empty when stdout is redirected (see STDOUT_IS_TTY)
+C_RED = '\033[91m' if STDOUT_IS_TTY else ''
+C_YELLOW = '\033[93m' if STDOUT_IS_TTY else ''
+C_CYAN = '\033[96m' if STDOUT_IS_TTY else ''
+C_GREEN = '\033[92m' if STDOUT_IS_TTY else ''
+C_RESET = '\033[0m' if STDOUT_IS_TTY else ''
+C_BLUE = '\033[94m' if STDOUT_IS_TTY else ''
+
+# Signals in the last observation that the next step needs the full executor model
+_TROUBLE_RE = re.compile(r'error|fail|traceback|exception|stuck|loop', re.IGNORECASE)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+# Failure detection: "COMMAND FAILED" anywhere in the untrimmed output, or output that
+# starts (after whitespace) with "Error:"; match() avoids copying via strip()
+_ERROR_PREFIX_RE = re.compile(r'\s*Error:')
+# Per-action output kept for the summary (head and tail chars). At least the 4k/16k
+# window summarize_execution sends, so the summarizer sees the same text
+_ACTION_OUTPUT_HEAD = 8000
+_ACTION_OUTPUT_TAIL = 32000
 
 
 class Worker:
-    def __init__(self, llm_client: LLMClient, tools: List[Any] = None, print_func: Callable = print, debug_mode: bool = False):
+    def __init__(self, llm_client: LLMClient, tools: List[Any] = None, print_func: Callable = print, debug_mode: bool = False,
+                 speculative_execution: bool = False, pipeline_milestones: bool = False,
+                 fused_plan_action: bool = False, action_cache: bool = False,
+                 parallel_tools: bool = False):
         self.llm_client = llm_client
         self.tools = {tool.name: tool for tool in tools} if tools else {}
+        # Rendered tool lists, rebuilt only when the toolset changes (see register_tools)
+        self._tools_description: Optional[str] = None
+        self._preflight_tools_description: Optional[str] = None
+        # System prompts built from them; byte-identical across iterations so the
+        # provider's prefix cache keeps hitting
+        self._system_prompt: Optional[str] = None
+        self._preflight_system_prompt: Optional[str] = None
         self.logger = get_logger()
         self.print_func = print_func
         self.debug_mode = debug_mode
+        # Issue the executor call for the previous step's suggested actions while the
+        # planner runs; the result is used only if the real executor prompt is identical.
+        self.speculative_execution = speculative_execution
+        # Run iteration N's milestone analysis concurrently with iteration N+1's planner.
+        # The planner then sees milestones one step late (the result itself is already in
+        # last_observation); the executor always gets the up-to-date list.
+        self.pipeline_milestones = pipeline_milestones
+        self._milestone_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_milestones: Optional[Future] = None
+        # Renders the full open-files view while the planner call is in flight
+        self._render_pool: Optional[ThreadPoolExecutor] = None
+        # When planner and executor are the same model, ask the planner call for the
+        # first actions too; they replace the executor call if pre-flight changes nothing.
+        self.fused_plan_action = fused_plan_action
+        # Executor responses whose actions all succeeded, keyed by a digest of the exact
+        # executor prompt; an identical first-attempt prompt reuses them without a call
+        self.action_cache = action_cache
+        self._action_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._action_cache_size = 128
+        # Run consecutive actions that share a "parallel_group" concurrently (the
+        # executor is told about the field only when this is on)
+        self.parallel_tools = parallel_tools
+        self._tool_pool: Optional[ThreadPoolExecutor] = None
         
         # Initialize debug logging ONCE per worker instance
         self._debug_initialized = False
@@ -45,16 +94,37 @@ class Worker:
         
         # --- STATE MODEL ---
         self.current_plan = "No plan formulated yet."
-        self.open_files = {} 
+        # Least recently opened/updated first; see update_open_file for the size cap
+        self.open_files: "OrderedDict[str, str]" = OrderedDict()
+        self._open_files_chars = 0
+        self._open_files_lock = threading.Lock()  # parallel tool groups may open/close files concurrently
+        # Rendered views of open_files, dropped whenever a file is opened, edited or closed
+        self._open_files_rendered: Optional[Tuple[int, str]] = None  # (token budget, text)
+        self._compact_blocks: Dict[str, str] = {}
         self.recent_history = deque(maxlen=50) 
         self.completed_milestones = []  # Foundational progress markers, append-only
         self.last_observation = "None."
+        self._last_suggested_actions = None
+        self._last_saved_objective: Optional[str] = None
         
         # Load directives from central prompts module
         self.base_directives = CORE_DIRECTIVES
         self.docker_directives = DOCKER_DIRECTIVES
         self.important_reminders = IMPORTANT_REMINDERS
         self.max_history_tokens = 25000
+        # Per-step cap applied when a step is recorded, so one huge result cannot eat the history budget
+        self.max_history_entry_tokens = 2000
+        self.max_open_files_tokens = 40000
+        # Hard cap on content held in working memory (prompts are already budgeted by
+        # max_open_files_tokens; this bounds what the worker keeps resident)
+        self.max_open_files_chars = 1_000_000
+
+        # Static prompt scaffolding shared by every builder, assembled once here
+        # rather than re-derived on each call
+        self._directives_prefix = DIRECTIVES_BLOCK
+        self._reminders_section = f"**Important Reminders**\n{self.important_reminders}\n" if self.important_reminders.strip() else ""
+        self._executor_instructions = (f"{EXECUTOR_INSTRUCTIONS}\n\n{PARALLEL_TOOLS_NOTE}" if parallel_tools
+                                       else EXECUTOR_INSTRUCTIONS)
 
     def _init_debug_logging(self):
         """Initialize debug logging once per worker instance."""
@@ -69,21 +139,45 @@ class Worker:
     def register_tools(self, tools_list: List[Any]):
         for tool in tools_list:
             self.tools[tool.name] = tool
-
-    def update_open_file(self, path: str, content: str):
+        self._tools_description = None
+        self._preflight_tools_description = None
+        self._system_prompt = None
+        self._preflight_system_prompt = None
+
+    def update_open_file(self, path: str, content: str) -> List[str]:
+        """Open or refresh a file in working memory. If the total content exceeds
+        max_open_files_chars, the least recently touched files are closed; their
+        paths are returned so the caller can report it."""
         # Normalize to absolute path for consistency
         abs_path = os.path.abspath(path)
-        self.open_files[abs_path] = content
+        evicted = []
+        with self._open_files_lock:
+            self._open_files_rendered = None
+            self._compact_blocks.pop(abs_path, None)
+            previous = self.open_files.pop(abs_path, None)
+            if previous is not None:
+                self._open_files_chars -= len(previous)
+            self.open_files[abs_path] = content
+            self._open_files_chars += len(content)
+            while self._open_files_chars > self.max_open_files_chars and len(self.open_files) > 1:
+                old_path, old_content = self.open_files.popitem(last=False)
+                self._open_files_chars -= len(old_content)
+                self._compact_blocks.pop(old_path, None)
+                evicted.append(old_path)
+        if evicted:
+            self.logger.info(f"Working memory over {self.max_open_files_chars} chars, closed: {', '.join(evicted)}")
+        return evicted
 
     def close_file(self, path: str) -> bool:
         abs_path = os.path.abspath(path)
-        if abs_path in self.open_files:
-            del self.open_files[abs_path]
-            return True
         # Also check original path for backwards compatibility
-        if path in self.open_files:
-            del self.open_files[path]
-            return True
+        with self._open_files_lock:
+            for key in (abs_path, path):
+                if key in self.open_files:
+                    self._open_files_chars -= len(self.open_files.pop(key))
+                    self._open_files_rendered = None
+                    self._compact_blocks.pop(key, None)
+                    return True
         return False
 
     def is_file_open(self, path: str) -> bool:
@@ -91,28 +185,44 @@ class Worker:
         return abs_path in self.open_files or path in self.open_files
 
     def _get_tools_description(self) -> str:
-        descs = []
-        for name, tool in self.tools.items():
-            descs.append(f"- {name}: {tool.description}")
-        return "\n".join(descs)
+        if self._tools_description is None:
+            self._tools_description = "\n".join(f"- {name}: {tool.description}" for name, tool in self.tools.items())
+        return self._tools_description
 
     def _get_preflight_tools_description(self) -> str:
         """Get tool descriptions for only file management tools (pre-flight phase)."""
-        preflight_tools = ['open_file', 'close_file']
-        descs = []
-        for name in preflight_tools:
-            if name in self.tools:
-                tool = self.tools[name]
-                descs.append(f"- {name}: {tool.description}")
-        return "\n".join(descs)
+        if self._preflight_tools_description is None:
+            preflight_tools = ['open_file', 'close_file']
+            self._preflight_tools_description = "\n".join(
+                f"- {name}: {self.tools[name].description}" for name in preflight_tools if name in self.tools
+            )
+        return self._preflight_tools_description
 
     def _format_open_files(self) -> str:
+        """Full contents of open files, kept within max_open_files_tokens.
+        Small files are always shown whole; the budget they leave is split evenly
+        among the larger ones, which are cut in the middle (head and tail kept)."""
         if not self.open_files:
             return "No files currently open."
+        if self._open_files_rendered is not None and self._open_files_rendered[0] == self.max_open_files_tokens:
+            return self._open_files_rendered[1]
+        budgets = {}
+        remaining = self.max_open_files_tokens
+        by_size = sorted(self.open_files.items(), key=lambda kv: len(kv[1]))
+        for i, (path, content) in enumerate(by_size):
+            share = remaining // (len(by_size) - i)
+            budgets[path] = share
+            remaining -= min(len(content) // 4 + 1, share)
         out = []
         for path, content in self.open_files.items():
-            out.append(f"--- FILE: {path} ---\n{content}\n--- END FILE ---")
-        return "\n\n".join(out)
+            shown = truncate_to_tokens(content, budgets[path])
+            if shown is not content:
+                self.logger.info(f"Open file {path} truncated for prompt: {len(content)} -> {len(shown)} chars")
+                shown += "\n[File truncated to fit the context budget; use a script (grep/sed) to inspect the omitted middle.]"
+            out.append(f"--- FILE: {path} ---\n{shown}\n--- END FILE ---")
+        rendered = "\n\n".join(out)
+        self._open_files_rendered = (self.max_open_files_tokens, rendered)
+        return rendered
 
     def _format_open_files_list(self) -> str:
         """Return just a list of currently open file paths (no content).
@@ -129,14 +239,17 @@ class Worker:
             return "No files currently open."
         out = []
         for path, content in self.open_files.items():
-            lines = content.splitlines()
-            line_count = len(lines)
-            head = lines[:8]
-            tail = lines[-4:] if line_count > 12 else []
-            peek = '\n'.join(head)
-            if tail:
-                peek += f'\n  ... ({line_count - 12} lines omitted) ...\n' + '\n'.join(tail)
-            out.append(f"--- FILE: {path} ({line_count} lines) ---\n{peek}\n--- END ---")
+            block = self._compact_blocks.get(path)
+            if block is None:
+                lines = content.splitlines()
+                line_count = len(lines)
+                head = lines[:8]
+                tail = lines[-4:] if line_count > 12 else []
+                peek = '\n'.join(head)
+                if tail:
+                    peek += f'\n  ... ({line_count - 12} lines omitted) ...\n' + '\n'.join(tail)
+                block = self._compact_blocks[path] = f"--- FILE: {path} ({line_count} lines) ---\n{peek}\n--- END ---"
+            out.append(block)
         return "\n\n".join(out)
 
     def _format_open_files_for_executor(self, suggested_actions: str) -> str:
@@ -188,21 +301,8 @@ class Worker:
         formatted = []  # collects entries newest-first
 
         for idx_from_end, step in enumerate(reversed(items)):
-            iteration = step['iteration']
-            action = step['action']
-            summary = step.get('summary', '')
-
-            if idx_from_end < 3:
-                # FULL tier - complete context for most recent work
-                entry = f"STEP {iteration} [FULL]:\nAction: {action}\nResult Summary: {summary}\n"
-            elif idx_from_end < 10:
-                # BRIEF tier - action + first 2 sentences
-                brief = self._first_n_sentences(summary, 2)
-                entry = f"STEP {iteration} [BRIEF]:\nAction: {action}\nResult: {brief}\n"
-            else:
-                # MINIMAL tier - one-line label with pass/fail
-                status = 'FAIL' if any(kw in summary.upper() for kw in ('FAILED', 'ERROR', 'STUCK')) else 'OK'
-                entry = f"STEP {iteration}: {action} [{status}]\n"
+            tier = 0 if idx_from_end < 3 else 1 if idx_from_end < 10 else 2
+            entry = self._render_history_entry(step, tier)
 
             entry_chars = len(entry)
             if used_chars + entry_chars > budget_chars:
@@ -216,12 +316,76 @@ class Worker:
         formatted.reverse()
         return "\n".join(formatted)
 
+    @staticmethod
+    def _execute_tool(tool, tool_name: str, params: Dict):
+        """Run one tool, turning exceptions into an error result for the executor to read."""
+        try:
+            return tool.execute(**params)
+        except TypeError as e:
+            return f"Tool Parameter Error: {e}. Check required parameters for '{tool_name}'."
+        except Exception as e:
+            return f"Tool Execution Error: {type(e).__name__}: {e}"
+
+    def _submit_parallel_group(self, actions: List[Dict], start: int, terminal_tools: List[str]) -> Dict[int, Future]:
+        """If actions[start] opens a run of two or more consecutive actions with the same
+        parallel_group, start them all on the tool pool and return {index: Future}.
+        Terminal tools, get_user_input and unknown tools are never grouped."""
+        group = actions[start].get("parallel_group")
+        if group is None:
+            return {}
+        members = []
+        for idx in range(start, len(actions)):
+            action = actions[idx]
+            tool_name = action.get("tool_name")
+            if (action.get("parallel_group") != group or tool_name not in self.tools
+                    or tool_name in terminal_tools or tool_name == "get_user_input"):
+                break
+            members.append(idx)
+        if len(members) < 2:
+            return {}
+        if self._tool_pool is None:
+            self._tool_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="aeon-tools")
+        return {
+            idx: self._tool_pool.submit(self._execute_tool, self.tools[actions[idx]["tool_name"]],
+                                        actions[idx]["tool_name"], actions[idx].get("parameters", {}))
+            for idx in members
+        }
+
+    def _record_history(self, iteration: int, action: str, summary: str) -> None:
+        summary = truncate_to_tokens(summary, self.max_history_entry_tokens)
+        self.recent_history.append({"iteration": iteration, "action": action, "summary": summary})
+
+    def _render_history_entry(self, step: Dict, tier: int) -> str:
+        """Render one history step at a detail tier (0 FULL, 1 BRIEF, 2 MINIMAL).
+        Steps never change once appended, so each tier is rendered once and kept on
+        the step; later iterations only re-join the cached strings."""
+        rendered = step.setdefault('_rendered', {})
+        entry = rendered.get(tier)
+        if entry is not None:
+            return entry
+        iteration = step['iteration']
+        action = step['action']
+        summary = step.get('summary', '')
+        if tier == 0:
+            # FULL tier - complete context for most recent work
+            entry = f"STEP {iteration} [FULL]:\nAction: {action}\nResult Summary: {summary}\n"
+        elif tier == 1:
+            # BRIEF tier - action + first 2 sentences
+            brief = self._first_n_sentences(summary, 2)
+            entry = f"STEP {iteration} [BRIEF]:\nAction: {action}\nResult: {brief}\n"
+        else:
+            # MINIMAL tier - one-line label with pass/fail
+            status = 'FAIL' if any(kw in summary.upper() for kw in ('FAILED', 'ERROR', 'STUCK')) else 'OK'
+            entry = f"STEP {iteration}: {action} [{status}]\n"
+        rendered[tier] = entry
+        return entry
+
     @staticmethod
     def _first_n_sentences(text: str, n: int) -> str:
         """Extract roughly the first n sentences from text."""
         if not text:
             return ''
-        sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+        sentences = _SENTENCE_SPLIT_RE.split(text.strip())
         result = ' '.join(sentences[:n])
         if len(sentences) > n:
             result += ' [...]'
@@ -234,35 +398,62 @@ class Worker:
 
     def _reset_state(self, initial_observation="Project started."):
         self.current_plan = "Initial state. Need to formulate a plan."
-        self.open_files = {}
+        self.open_files = OrderedDict()
+        self._open_files_chars = 0
+        self._open_files_rendered = None
+        self._compact_blocks.clear()
         self.recent_history.clear()
         self.completed_milestones = []
         self.last_observation = initial_observation
+        self._last_suggested_actions = None
+        if self._pending_milestones is not None:
+            self._pending_milestones.cancel()  # belongs to the previous objective
+            self._pending_milestones = None
 
     def _save_objective(self, objective: str):
+        # Re-running the same objective (e.g. resuming after an interruption) adds nothing to the log
+        if objective == self._last_saved_objective:
+            return
         try:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             entry = f"[{timestamp}] OBJECTIVE UPDATE:\n{objective}\n{'-'*40}\n"
             with open(".previous_objective.txt", "a", encoding="utf-8") as f:
                 f.write(entry)
+            self._last_saved_objective = objective
         except Exception as e:
             self.logger.error(f"Failed to save objective to file: {e}")
 
-    def _build_planner_context(self, tool_list_str: str, system_specs: str, 
-                               milestones_str: str, objective: str, history_str: str, open_files_str: str) -> str:
-        """Build the complete planner prompt with instructions at the end."""
-        reminders_section = f"**Important Reminders**\n{self.important_reminders}\n" if self.important_reminders.strip() else ""
-        
-        return f"""{self.base_directives}
+    def _build_system_prompt(self, tool_list_str: str, tools_heading: str = "**Available Tools**") -> str:
+        """Directives, tools and reminders: the part of every agent prompt that only changes
+        with the toolset. Sent as the system message so providers can cache it as a prefix."""
+        return f"""{self._directives_prefix}
 
-{self.docker_directives}
-
-**Available Tools**
+{tools_heading}
 {tool_list_str}
 
-{reminders_section}
-
-{system_specs}
+{self._reminders_section}"""
+
+    def _get_system_prompt(self) -> str:
+        if self._system_prompt is None:
+            self._system_prompt = self._build_system_prompt(self._get_tools_description())
+        return self._system_prompt
+
+    def _get_preflight_system_prompt(self) -> str:
+        if self._preflight_system_prompt is None:
+            self._preflight_system_prompt = self._build_system_prompt(
+                self._get_preflight_tools_description(),
+                "**Available Tools (Pre-flight Phase - File Management Only)**"
+            )
+        return self._preflight_system_prompt
+
+    def _build_planner_context(self, system_specs: str, milestones_str: str, objective: str,
+                               history_str: str, open_files_str: str) -> str:
+        """Build the planner user prompt (after _build_system_prompt) with instructions at the end.
+        Sections run from most to least stable (objective, append-only milestones, then
+        per-iteration state) so consecutive calls share the longest possible prefix for
+        provider-side prompt caching; live system stats go last."""
+        return f"""**Objective**
+{objective}
 
 **Completed Milestones (Foundational Progress)**
 {milestones_str}
@@ -270,81 +461,55 @@ class Worker:
 **Open Files (Working Memory)**
 {open_files_str}
 
-**Objective**
-{objective}
-
 **Current Saved Plan**
 {self.current_plan}
 
 **Recent History (Last 10 steps)**
 {history_str}
 
+{system_specs}
+
 **Last Observation (From previous step)**
 {self.last_observation}
 
 {PLANNER_INSTRUCTIONS}"""
 
-    def _build_preflight_executor_context(self, tool_list_str: str, system_specs: str,
+    def _build_preflight_executor_context(self, system_specs: str,
                                           suggested_actions: str, open_files_list: str) -> str:
-        """Build the pre-flight executor prompt for context gathering phase."""
-        reminders_section = f"**Important Reminders**\n{self.important_reminders}\n" if self.important_reminders.strip() else ""
-
-        return f"""{self.base_directives}
-
-{self.docker_directives}
-
-**Available Tools (Pre-flight Phase - File Management Only)**
-{tool_list_str}
-
-{reminders_section}
+        """Build the pre-flight executor user prompt for context gathering phase (stable sections first, as in the planner)."""
+        return f"""**Currently Open Files (Paths Only)**
+{open_files_list}
 
 {system_specs}
 
-**Currently Open Files (Paths Only)**
-{open_files_list}
-
 **Planner's Suggested Actions**
 {suggested_actions}
 
 {PREFLIGHT_INSTRUCTIONS}"""
 
-    def _build_executor_context(self, tool_list_str: str, milestones_str: str,
-                                objective: str,
+    def _build_executor_context(self, milestones_str: str, objective: str,
                                 suggested_actions: str, open_files_str: str) -> str:
-        """Build the complete executor prompt with instructions at the end.
+        """Build the executor user prompt (after _build_system_prompt) with instructions at the end.
         Note: The full plan is intentionally omitted. The executor receives the
         distilled suggested_actions from the planner which contains everything
         it needs. Sending the full plan wastes context and confuses weaker models."""
-        reminders_section = f"**Important Reminders**\n{self.important_reminders}\n" if self.important_reminders.strip() else ""
-
-        return f"""{self.base_directives}
-
-{self.docker_directives}
-
-**Available Tools**
-{tool_list_str}
-
-{reminders_section}
+        return f"""**Objective**
+{objective}
 
 **Completed Milestones (Foundational Progress)**
 {milestones_str}
 
-**Objective**
-{objective}
-
 **Your Task (from Planner)**
 {suggested_actions}
 
 **Open Files (Working Memory)**
 {open_files_str}
 
-{EXECUTOR_INSTRUCTIONS}"""
+{self._executor_instructions}"""
 
     def _build_base_context(self, tool_list_str: str) -> str:
         """Build base context without role-specific instructions (used for milestone analyzer)."""
-        return f"""{self.base_directives}
-
-{self.docker_directives}
+        return f"""{self._directives_prefix}
 
 **Available Tools**
 {tool_list_str}
@@ -358,9 +523,17 @@ class Worker:
         milestones, and this iteration's results. No tools/directives/history needed.
         """
         try:
-            milestones_str = self._format_milestones()
-            
-            analysis_context = f"""{MILESTONE_ANALYZER_INSTRUCTIONS}
+            self._apply_milestones(self._request_milestones(objective, iteration, actions_taken, iteration_result))
+        except Exception as e:
+            self.logger.warning(f"Milestone analysis failed: {e}")
+            # Non-fatal - continue without milestone update
+
+    def _request_milestones(self, objective: str, iteration: int,
+                            actions_taken: List[str], iteration_result: str) -> Dict:
+        """Build the analyzer prompt and return the raw response (no state changes, safe off-thread)."""
+        milestones_str = self._format_milestones()
+        
+        analysis_context = f"""{MILESTONE_ANALYZER_INSTRUCTIONS}
 
 **Objective**
 {objective}
@@ -373,24 +546,43 @@ Actions Taken: {', '.join(actions_taken)}
 Result:
 {iteration_result}
 """
-            
-            response = self.llm_client.analyze_milestones(analysis_context)
-            
-            if response and isinstance(response, dict):
-                new_milestones = response.get("milestones_achieved", [])
-                if new_milestones and isinstance(new_milestones, list):
-                    for milestone in new_milestones:
-                        if milestone and isinstance(milestone, str) and milestone.strip() and milestone not in self.completed_milestones:
-                            self.completed_milestones.append(milestone.strip())
-                            self.print_func(f"{C_GREEN}>> MILESTONE ACHIEVED: {milestone}{C_RESET}")
-                            
+        
+        return self.llm_client.analyze_milestones(analysis_context)
+
+    def _apply_milestones(self, response: Dict) -> None:
+        if response and isinstance(response, dict):
+            new_milestones = response.get("milestones_achieved", [])
+            if new_milestones and isinstance(new_milestones, list):
+                for milestone in new_milestones:
+                    if milestone and isinstance(milestone, str) and milestone.strip() and milestone not in self.completed_milestones:
+                        self.completed_milestones.append(milestone.strip())
+                        self.print_func(f"{C_GREEN}>> MILESTONE ACHIEVED: {milestone}{C_RESET}")
+
+    def _submit_milestones(self, *args) -> None:
+        """Start milestone analysis in the background (see pipeline_milestones)."""
+        self._collect_milestones()
+        if self._milestone_pool is None:
+            self._milestone_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aeon-milestones")
+        self._pending_milestones = self._milestone_pool.submit(self._request_milestones, *args)
+
+    def _collect_milestones(self) -> bool:
+        """Wait for and apply any in-flight milestone analysis. Returns True if one was applied."""
+        pending, self._pending_milestones = self._pending_milestones, None
+        if pending is None or pending.cancelled():
+            return False
+        try:
+            self._apply_milestones(pending.result())
+            return True
         except Exception as e:
             self.logger.warning(f"Milestone analysis failed: {e}")
-            # Non-fatal - continue without milestone update
+            return False
 
     def _clean_action_json(self, raw_str: str) -> str:
         """Clean and extract JSON from potentially markdown-wrapped LLM response."""
         clean_json = raw_str.strip()
+        # get_action already returns extracted JSON, so there is usually no fence at all
+        if not clean_json.startswith("```") and not clean_json.endswith("```"):
+            return clean_json
         
         # Handle ```json with optional whitespace/newline
         if clean_json.startswith("```json"):
@@ -446,35 +638,62 @@ Result:
                 
                 # Gather context components
                 system_specs = get_runtime_info()
-                tool_list_str = self._get_tools_description()
                 milestones_str = self._format_milestones()
                 history_str = self._format_history()
-                open_files_str = self._format_open_files()
                 
                 # Build planner prompt (instructions at end for emphasis)
                 # Planner gets compact file manifest; executor gets full content
                 compact_files_str = self._format_open_files_compact()
+                system_prompt = self._get_system_prompt()
                 planner_prompt = self._build_planner_context(
-                    tool_list_str, system_specs, milestones_str, objective, history_str, compact_files_str
+                    system_specs, milestones_str, objective, history_str, compact_files_str
                 )
 
+                # Speculative executor prompt: assumes the planner repeats last step's actions
+                speculative_prompt = None
+                speculative_action = None
+                open_files_future = None
+                if self.speculative_execution and self._last_suggested_actions:
+                    open_files_str = self._format_open_files()
+                    speculative_prompt = self._build_executor_context(
+                        milestones_str, objective,
+                        self._last_suggested_actions, open_files_str
+                    )
+                else:
+                    # Nothing before the planner needs the full view; build it (truncation
+                    # and token counting over every open file) while the planner runs
+                    if self._render_pool is None:
+                        self._render_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aeon-render")
+                    open_files_future = self._render_pool.submit(self._format_open_files)
+
                 # --- PLANNER ---
                 self.print_func("Thinking (Planning)...")
+                suggested_actions_str = "No specific actions suggested."
                 
+                fused_action = None
                 try:
-                    plan_response_str = self.llm_client.get_plan(prompt=planner_prompt)
+                    if self.fused_plan_action and speculative_prompt is None:
+                        plan_response_str, fused_action = self.llm_client.plan_and_act(planner_prompt, system=system_prompt)
+                    else:
+                        plan_response_str, speculative_action = self.llm_client.get_plan_and_action(
+                            planner_prompt, speculative_prompt, system=system_prompt
+                        )
                     if self.debug_mode:
                         self.print_func(f"{C_YELLOW}[DEBUG] Planner Raw Output:\n{plan_response_str}{C_RESET}")
                     
-                    suggested_actions_str = "No specific actions suggested."
-                    
                     # PARSE PLANNER RESPONSE
-                    plan_data = json.loads(plan_response_str)
+                    plan_data = json_loads(plan_response_str)
                     self.current_plan = plan_data.get("updated_plan") or self.current_plan
                 except Exception as e:
                     self.print_func(f"{C_RED}PLANNER CRASHED: {e}{C_RESET}")
                     plan_data = {}
+                if open_files_future is not None:
+                    open_files_str = open_files_future.result()
                 
+                # Fold in last iteration's background milestone analysis before the executor prompts are built
+                if self._collect_milestones():
+                    milestones_str = self._format_milestones()
+
                 # Format suggested actions for executor (now free-form text from planner)
                 next_actions = plan_data.get("next_actions") or ""
                 if next_actions:
@@ -491,6 +710,7 @@ Result:
                         suggested_actions_str = "\n".join(action_lines)
                     else:
                         suggested_actions_str = str(next_actions)
+                self._last_suggested_actions = suggested_actions_str
                 
                 analysis = plan_data.get("analysis", "")
                 iteration_strategy = plan_data.get("iteration_strategy", "single_step")
@@ -501,13 +721,33 @@ Result:
                 if risk_notes:
                     self.print_func(f"{C_YELLOW}Risks:{C_RESET} {risk_notes}")
                 
-                plan_lines = self.current_plan.split('\n')
-                if len(plan_lines) > 8:
+                # Most plans are short; only split when there are lines to cut
+                if self.current_plan.count('\n') >= 8:
+                    plan_lines = self.current_plan.split('\n')
                     preview = '\n'.join(plan_lines[:4]) + f'\n{C_YELLOW}... [plan truncated] ...{C_RESET}\n' + '\n'.join(plan_lines[-4:])
                 else:
                     preview = self.current_plan
                 self.print_func(f"{C_CYAN}Plan Update:{C_RESET}\n{preview}")
-                    
+
+                # First attempt at a short single-step task after a clean observation can
+                # go to the weak model; retries always use the full executor
+                first_attempt_weak = (iteration_strategy == "single_step"
+                                      and self.estimate_tokens(suggested_actions_str) < 150
+                                      and not _TROUBLE_RE.search(self.last_observation))
+
+                # Start the main executor alongside pre-flight, betting that pre-flight leaves
+                # the open files unchanged; the response is only used if the prompt matches
+                early_prompt = None
+                early_future = None
+                if self.speculative_execution and not fused_action:
+                    early_prompt = self._build_executor_context(
+                        milestones_str, objective,
+                        suggested_actions_str, self._format_open_files()
+                    )
+                    if not (speculative_action and early_prompt == speculative_prompt):
+                        early_future = self.llm_client.submit_action(
+                            early_prompt, prefer_weak=first_attempt_weak, system=system_prompt
+                        )
 
                 # --- PRE-FLIGHT EXECUTOR (Context Gathering Phase) ---
                 if step_callback:
@@ -515,16 +755,15 @@ Result:
 
                 self.print_func("Pre-flight: Gathering file context...")
                 
-                preflight_tool_list = self._get_preflight_tools_description()
                 open_files_list = self._format_open_files_list()
+                preflight_system = self._get_preflight_system_prompt()
                 preflight_prompt = self._build_preflight_executor_context(
-                    preflight_tool_list, system_specs,
-                    suggested_actions_str, open_files_list
+                    system_specs, suggested_actions_str, open_files_list
                 )
 
                 try:
-                    preflight_json = self.llm_client.get_action(prompt=preflight_prompt)
-                    preflight_data = json.loads(self._clean_action_json(preflight_json))
+                    preflight_json = self.llm_client.get_action(prompt=preflight_prompt, system=preflight_system)
+                    preflight_data = json_loads(self._clean_action_json(preflight_json))
                     preflight_actions = preflight_data.get("actions", [])
                     
                     if not preflight_actions:
@@ -539,12 +778,13 @@ Result:
                                 self.logger.warning(f"Pre-flight: Ignoring invalid tool '{tool_name}'")
                                 continue
                                 
-                            if tool_name not in self.tools:
+                            tool = self.tools.get(tool_name)
+                            if tool is None:
                                 self.logger.warning(f"Pre-flight: Tool '{tool_name}' not found")
                                 continue
                             
                             try:
-                                result = self.tools[tool_name].execute(**params)
+                                result = tool.execute(**params)
                                 self.print_func(f"Pre-flight: {tool_name} {params.get('file_path', '?')}")
                             except Exception as e:
                                 self.logger.warning(f"Pre-flight {tool_name} failed: {e}")
@@ -560,10 +800,15 @@ Result:
                 # Now format files with full content for main executor
                 executor_files_str = self._format_open_files()
                 executor_prompt = self._build_executor_context(
-                    tool_list_str, milestones_str,
-                    objective,
+                    milestones_str, objective,
                     suggested_actions_str, executor_files_str
                 )
+                if early_future is not None and executor_prompt != early_prompt:
+                    # Pre-flight changed the working set, the early response is stale
+                    early_future.cancel()
+                    early_future = None
+                if fused_action and executor_files_str != open_files_str:
+                    fused_action = None  # written against a working set that no longer exists
 
                 max_exec_retries = 3
                 last_fail_step = -1
@@ -589,7 +834,36 @@ Result:
                     else:
                         current_prompt = executor_prompt
 
-                    action_json_str = self.llm_client.get_action(prompt=current_prompt)
+                    action_json_str = None
+                    action_key = None
+                    if exec_attempt == 0 and self.action_cache:
+                        action_key = hashlib.blake2b(
+                            f"{system_prompt}\x00{current_prompt}".encode("utf-8"), digest_size=16
+                        ).hexdigest()
+                    if action_key is not None and action_key in self._action_cache:
+                        self.print_func("Reusing cached actions for an identical executor prompt.")
+                        action_json_str = self._action_cache[action_key]
+                        self._action_cache.move_to_end(action_key)
+                        if early_future is not None:
+                            early_future.cancel()
+                            early_future = None
+                    elif exec_attempt == 0 and speculative_action and current_prompt == speculative_prompt:
+                        self.print_func("Using speculative executor response.")
+                        action_json_str = speculative_action
+                    elif exec_attempt == 0 and fused_action:
+                        self.print_func("Using planner-written actions.")
+                        action_json_str = fused_action
+                    elif exec_attempt == 0 and early_future is not None:
+                        try:
+                            action_json_str = early_future.result()
+                            self.print_func("Using early executor response.")
+                        except Exception as e:
+                            self.logger.warning(f"Early executor call failed: {e}")
+                    if action_json_str is None:
+                        action_json_str = self.llm_client.get_action(
+                            prompt=current_prompt, prefer_weak=exec_attempt == 0 and first_attempt_weak,
+                            system=system_prompt
+                        )
                     if self.debug_mode:
                         self.print_func(f"{C_YELLOW}[DEBUG] Executor Raw Output:\n{action_json_str}{C_RESET}")
 
@@ -598,7 +872,7 @@ Result:
                     parse_failed = False
                     try:
                         clean_json = self._clean_action_json(action_json_str)
-                        parsed = json.loads(clean_json)
+                        parsed = json_loads(clean_json)
                         if isinstance(parsed, list):
                             actions = parsed
                         elif isinstance(parsed, dict):
@@ -628,6 +902,10 @@ Result:
 
                     # --- Execute actions ---
                     combined_summary_parts = []
+                    # Output the summarizer must see: any ALWAYS tool forces it, IF_LARGE
+                    # output counts toward the pass-through limit, NEVER output is ignored
+                    force_summary = False
+                    summarizable_chars = 0
                     actions_taken_str = []
                     error_at_step = -1
                     hit_early_exit = False
@@ -636,7 +914,11 @@ Result:
                         actions = actions[:15]
                         self.logger.warning("Truncated actions to 15")
 
+                    # Results of parallel groups, started when the loop reaches a group's first action
+                    group_futures: Dict[int, Future] = {}
                     for idx, action_data in enumerate(actions):
+                        if self.parallel_tools and idx not in group_futures:
+                            group_futures.update(self._submit_parallel_group(actions, idx, terminal_tools))
                         tool_name = action_data.get("tool_name")
                         params = action_data.get("parameters", {})
                         allow_failure = action_data.get("allow_failure", False)
@@ -646,7 +928,8 @@ Result:
                             error_at_step = idx
                             break
 
-                        if tool_name not in self.tools:
+                        tool = self.tools.get(tool_name)
+                        if tool is None:
                             combined_summary_parts.append(f"Action {idx+1}: Tool '{tool_name}' not found. Available: {list(self.tools.keys())}")
                             error_at_step = idx
                             break
@@ -656,12 +939,11 @@ Result:
 
                         if tool_name in terminal_tools:
                             try:
-                                tool = self.tools[tool_name]
                                 result_str = str(tool.execute(**params))
                             except Exception as e:
                                 result_str = f"Error executing terminal tool {tool_name}: {e}"
                             self.print_func(f"\n{C_GREEN}{result_str}{C_RESET}")
-                            self.recent_history.append({"iteration": iteration, "action": tool_name, "summary": result_str})
+                            self._record_history(iteration, tool_name, result_str)
                             if step_callback: step_callback(iteration, display_max, "Complete")
                             return
 
@@ -676,28 +958,41 @@ Result:
                             break
 
                         else:
-                            try:
-                                tool = self.tools[tool_name]
-                                raw_result = tool.execute(**params)
-                            except TypeError as e:
-                                raw_result = f"Tool Parameter Error: {e}. Check required parameters for '{tool_name}'."
-                            except Exception as e:
-                                raw_result = f"Tool Execution Error: {type(e).__name__}: {e}"
+                            future = group_futures.get(idx)
+                            raw_result = future.result() if future is not None else self._execute_tool(tool, tool_name, params)
 
                             result_str = str(raw_result)
+                            # Check the untrimmed output: a banner past the head would be cut below
+                            failed = "COMMAND FAILED" in result_str or bool(_ERROR_PREFIX_RE.match(result_str))
+                            omitted = len(result_str) - _ACTION_OUTPUT_HEAD - _ACTION_OUTPUT_TAIL
+                            if omitted > 0:
+                                # Drop the middle of huge outputs now rather than carrying
+                                # megabytes through the join and the summarizer call
+                                result_str = (f"{result_str[:_ACTION_OUTPUT_HEAD]}\n... [TRUNCATED {omitted} CHARS] ...\n"
+                                              f"{result_str[-_ACTION_OUTPUT_TAIL:]}")
                             combined_summary_parts.append(f"Action {idx+1} ({tool_name}):\n{result_str}")
+                            policy = getattr(tool, "summarize_policy", SummarizePolicy.IF_LARGE)
+                            if policy is SummarizePolicy.ALWAYS:
+                                force_summary = True
+                            elif policy is SummarizePolicy.IF_LARGE:
+                                summarizable_chars += len(result_str)
 
-                            if "COMMAND FAILED" in result_str or result_str.strip().startswith("Error:"):
+                            if failed:
                                 if not allow_failure:
                                     error_at_step = idx
                                     break
 
+                    # A failure inside a parallel group stops the chain, but its siblings are
+                    # already running; let them finish before anything else touches the workspace
+                    if group_futures:
+                        wait(group_futures.values())
+
                     # --- Summarize this attempt ---
                     if not combined_summary_parts:
                         attempt_summary = "No actions executed."
                     else:
                         full_raw_output = "\n\n".join(combined_summary_parts)
-                        if len(full_raw_output) < 200 and len(actions) == 1 and actions[0].get("tool_name") != "run_command":
+                        if not force_summary and summarizable_chars < 200:
                             attempt_summary = full_raw_output
                         else:
                             command_context = f"Chain: {', '.join(actions_taken_str)}"
@@ -706,6 +1001,11 @@ Result:
                     # --- Decide: success, retry, or escalate ---
                     if error_at_step == -1 or hit_early_exit:
                         # All actions succeeded (or user input was requested)
+                        if action_key is not None and error_at_step == -1 and not hit_early_exit:
+                            self._action_cache[action_key] = action_json_str
+                            self._action_cache.move_to_end(action_key)
+                            while len(self._action_cache) > self._action_cache_size:
+                                self._action_cache.popitem(last=False)
                         final_summary = attempt_summary
                         final_actions_taken = actions_taken_str
                         break
@@ -752,16 +1052,19 @@ Result:
                         final_actions_taken = actions_taken_str
 
                 self.last_observation = final_summary
-                self.recent_history.append({"iteration": iteration, "action": f"Chain: {len(final_actions_taken)} tools", "summary": final_summary})
+                self._record_history(iteration, f"Chain: {len(final_actions_taken)} tools", final_summary)
 
                 # --- MILESTONE ANALYSIS (after iteration completes) ---
                 # Analyze if any foundational milestones were achieved this iteration
-                self._analyze_milestones(
-                    objective=objective,
-                    iteration=iteration,
-                    actions_taken=final_actions_taken,
-                    iteration_result=final_summary,
-                )
+                if self.pipeline_milestones:
+                    self._submit_milestones(objective, iteration, final_actions_taken, final_summary)
+                else:
+                    self._analyze_milestones(
+                        objective=objective,
+                        iteration=iteration,
+                        actions_taken=final_actions_taken,
+                        iteration_result=final_summary,
+                    )
 
             except KeyboardInterrupt:
                 self.print_func(f"\n{C_RED}PAUSED (User Interrupt).{C_RESET}")
@@ -805,5 +1108,8 @@ Result:
                     self.print_func(f"\n{C_RED}Forced Exit.{C_RESET}")
                     break
 
+        # Loop exits via break can leave the last iteration's analysis in flight
+        self._collect_milestones()
+
     def estimate_tokens(self, text):
-        return len(text) // 4
+        return estimate_tokens(text, limit=self.max_history_tokens)
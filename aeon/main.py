@@ -1,91 +1,184 @@
-import os, argparse, json, time, sys, subprocess, requests, fcntl, signal, atexit
+import os, argparse, json, time, sys, subprocess, fcntl, signal, atexit, threading, select, tempfile
+from functools import lru_cache
 from pathlib import Path
-from aeon.core.worker import Worker
-from aeon.core.llm import LLMClient
-from aeon.tools.loader import load_tools_from_directory
+
+from aeon.core.config import BRAIN
+
+# NOTE: requests, the LLM client (openai) and the tool tree are imported lazily
+# inside the functions that need them to keep CLI cold-start fast.
 
 LOCK_FILE_PATH = "/tmp/aeon_runtime.lock"
 STARTUP_LOCK_PATH = "/tmp/aeon_brain_startup.lock"
 MODEL_REGISTRY_PATH = "/tmp/aeon_model_registry.json"
 MODEL_REGISTRY_LOCK_PATH = "/tmp/aeon_model_registry.lock"
 
+@lru_cache(maxsize=1)
+def _http():
+    """Shared keep-alive session for all brain (Ollama) HTTP calls, created on first use."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+    return session
+
 def is_container_running(name):
     try: return bool(subprocess.check_output(["docker", "ps", "-q", "-f", f"name={name}"], stderr=subprocess.DEVNULL, text=True).strip())
     except: return False
 
-def wait_for_service(name, port):
-    print(f"Waiting for {name} (Port {port})...", end='', flush=True)
-    start = time.time()
-    while time.time() - start < 60:
+def wait_for_service(name, base_url):
+    import requests
+    print(f"Waiting for {name} ({base_url})...", end='', flush=True)
+    deadline = time.time() + BRAIN.wait_seconds
+    attempt = 0
+    # Poll fast at first and back off to BRAIN.poll_interval; the shared session reuses the connection
+    while time.time() < deadline:
         try:
-            if requests.get(f"http://localhost:{port}/api/tags", timeout=1).status_code == 200: 
+            if _http().get(f"{base_url}/api/tags", timeout=0.5).status_code == 200:
                 print(" OK.")
                 return True
-        except: pass
-        time.sleep(1)
+        except requests.RequestException: pass
+        time.sleep(min(0.2 * 1.3 ** attempt, BRAIN.poll_interval, max(deadline - time.time(), 0)))
+        attempt += 1
         print(".", end='', flush=True)
     print(" Timeout!")
     return False
 
 def start_local_brain_services():
-    """Start the Ollama brain container if not already running."""
+    """Start the Ollama brain container if not already running.
+
+    start_brain.sh signals readiness through a FIFO when Ollama logs that it is
+    listening, so we block on it (no CPU, no probes) and only fall back to HTTP
+    polling if no signal arrives within the wait window."""
     if is_container_running("aeon_brain_node"):
         print("[SYSTEM] Brain node already running.")
         return True
     print("\n[SYSTEM] Booting Local Brain...")
     script = Path(__file__).parent / "scripts" / "start_brain.sh"
-    subprocess.run(["bash", str(script)], check=True)
-    return wait_for_service("Aeon Brain (Ollama)", 8000)
+    fifo_dir = tempfile.mkdtemp(prefix="aeon_brain_")
+    fifo_path = os.path.join(fifo_dir, "ready")
+    os.mkfifo(fifo_path)
+    # Hold both ends open: the reader so the script's write never blocks, the writer
+    # so select() doesn't see EOF before the script has written anything
+    read_fd = os.open(fifo_path, os.O_RDONLY | os.O_NONBLOCK)
+    write_fd = os.open(fifo_path, os.O_WRONLY)
+    try:
+        env = {**os.environ, "AEON_READY_FIFO": fifo_path, "AEON_READY_TIMEOUT": str(int(BRAIN.wait_seconds))}
+        subprocess.run(["bash", str(script)], check=True, env=env)
+        print(f"Waiting for Aeon Brain (Ollama) ({BRAIN.url})...", end='', flush=True)
+        ready, _, _ = select.select([read_fd], [], [], BRAIN.wait_seconds)
+        if ready and os.read(read_fd, 64):
+            print(" OK.")
+            return True
+        print(" no readiness signal, polling.")
+    finally:
+        os.close(write_fd)
+        os.close(read_fd)
+        os.unlink(fifo_path)
+        os.rmdir(fifo_dir)
+    return wait_for_service("Aeon Brain (Ollama)", BRAIN.url)
+
+def _model_targets(strong_model, weak_model):
+    """(model, base_url) pairs naming the node that serves each model, deduplicated
+    when the same model on the same node is used for both roles."""
+    targets = [(m, url) for m, url in [(strong_model, BRAIN.planner_api_url), (weak_model, BRAIN.executor_api_url)] if m]
+    return list(dict.fromkeys(targets))
+
+def _brain_roots():
+    """Every Ollama-native root the agent talks to: the local brain plus the planner
+    and executor nodes, which differ when AEON_PLANNER_URL/AEON_EXECUTOR_URL are split."""
+    return list(dict.fromkeys([BRAIN.url, BRAIN.planner_api_url, BRAIN.executor_api_url]))
+
+def _unload_model(model):
+    """Ask every brain node to drop `model` from VRAM. The registry only records model
+    names, so we can't tell which node loaded it; an empty-prompt keep_alive=0 request
+    unloads without loading, so nodes that never had it are unaffected."""
+    for base_url in _brain_roots():
+        try:
+            _http().post(f"{base_url}/api/generate", json={"model": model, "keep_alive": 0}, timeout=BRAIN.unload_timeout)
+        except Exception as e:
+            print(f"[WARN] Failed to unload {model} on {base_url}: {e}")
 
 def warm_up_models(strong_model, weak_model):
-    """Preload models into VRAM by making initial requests."""
+    """Preload models into VRAM by making initial requests.
+
+    Both models are loaded concurrently so startup waits for the slower load
+    rather than the sum of both, each on the node that will serve it (the
+    executor may live elsewhere via AEON_EXECUTOR_URL)."""
+    import requests
+    from concurrent.futures import ThreadPoolExecutor
     print("[SYSTEM] Warming up models (preloading to VRAM)...")
-    models_to_warm = [m for m in [strong_model, weak_model] if m]
-    # Deduplicate if same model used for both
-    models_to_warm = list(dict.fromkeys(models_to_warm))
-    
-    for model in models_to_warm:
+    targets = _model_targets(strong_model, weak_model)
+
+    def _load(target):
+        model, base_url = target
         try:
-            print(f"[SYSTEM]  >> Loading {model}...", end='', flush=True)
-            resp = requests.post(
-                "http://localhost:8000/api/generate",
+            resp = _http().post(
+                f"{base_url}/api/generate",
                 json={"model": model, "prompt": "hello", "options": {"num_predict": 1}},
                 timeout=300  # Models can take a while to load
             )
             if resp.status_code == 200:
-                print(" OK.")
-            else:
-                print(f" Warning: Status {resp.status_code}")
+                return "OK."
+            return f"Warning: Status {resp.status_code}"
         except requests.exceptions.Timeout:
-            print(" Timeout (model may still be loading).")
+            return "Timeout (model may still be loading)."
         except Exception as e:
-            print(f" Error: {e}")
+            return f"Error: {e}"
+
+    for model, _ in targets:
+        print(f"[SYSTEM]  >> Loading {model}...")
+    with ThreadPoolExecutor(max_workers=max(len(targets), 1)) as pool:
+        for (model, _), status in zip(targets, pool.map(_load, targets)):
+            print(f"[SYSTEM]  >> {model}: {status}")
     print("[SYSTEM] Model warmup complete.")
 
+# Upper bound on one keepalive ping; exit() waits this long for an in-flight one
+_KEEPALIVE_PING_TIMEOUT = 10
+
+def _keep_models_warm(targets, stop):
+    """Background loop: touch each model on the node that serves it so Ollama's
+    keep_alive timer never lapses while the user is thinking at the prompt
+    (a 70B reload costs 10s+). `targets` comes from _model_targets and should
+    exclude the managed brain container, which already runs with OLLAMA_KEEP_ALIVE=-1."""
+    while not stop.wait(BRAIN.keepalive_interval):
+        for model, base_url in targets:
+            if stop.is_set():
+                return
+            try:
+                # No prompt: Ollama just (re)loads the model and resets its expiry
+                _http().post(f"{base_url}/api/generate", json={"model": model}, timeout=_KEEPALIVE_PING_TIMEOUT)
+            except Exception:
+                pass
+
 def cleanup_transient_tools():
     print("[SYSTEM] Cleaning up transient tool containers...")
     try:
         # Added timeout=5s to prevent hanging if Docker daemon is broken
-        subprocess.run("docker ps -a -q --filter 'name=aeon_research' --filter 'name=aeon_vision' | xargs -r docker rm -f", 
-                       shell=True, stderr=subprocess.DEVNULL, timeout=5)
+        listing = subprocess.run(["docker", "ps", "-a", "-q", "--filter", "name=aeon_research", "--filter", "name=aeon_vision"],
+                                 capture_output=True, text=True, timeout=5)
+        ids = listing.stdout.split()
+        if not ids:
+            return
+        subprocess.run(["docker", "rm", "-f", *ids], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
     except Exception as e:
         print(f"[WARN] Cleanup timed out or failed: {e}")
 
 def unload_local_brain():
     print("[SYSTEM] Last agent exiting. Releasing Brain VRAM...")
-    try:
-        resp = requests.get("http://localhost:8000/api/ps", timeout=3)
-        if resp.status_code == 200:
-            models = resp.json().get('models', [])
-            if not models:
-                print("[SYSTEM] No models loaded.")
-                return
-            for m in models:
-                print(f"[SYSTEM] Unloading {m['name']}...")
-                requests.post("http://localhost:8000/api/generate", json={"model": m['name'], "keep_alive": 0}, timeout=10)
-            print("[SYSTEM] VRAM released.")
-    except Exception as e:
-        print(f"[WARN] Failed to release VRAM: {e}")
+    for base_url in _brain_roots():
+        try:
+            resp = _http().get(f"{base_url}/api/ps", timeout=3)
+            if resp.status_code == 200:
+                models = resp.json().get('models', [])
+                if not models:
+                    print(f"[SYSTEM] No models loaded on {base_url}.")
+                    continue
+                for m in models:
+                    print(f"[SYSTEM] Unloading {m['name']} ({base_url})...")
+                    _http().post(f"{base_url}/api/generate", json={"model": m['name'], "keep_alive": 0}, timeout=BRAIN.unload_timeout)
+                print(f"[SYSTEM] VRAM released on {base_url}.")
+        except Exception as e:
+            print(f"[WARN] Failed to release VRAM on {base_url}: {e}")
 
 # =============================================================================
 # MODEL REFERENCE COUNTING
@@ -130,7 +223,7 @@ def register_models_for_agent(models):
             json.dump(registry, f, indent=2)
     for model in orphaned:
         print(f"[SYSTEM] Unloading orphaned model {model}...")
-        requests.post("http://localhost:8000/api/generate", json={"model": model, "keep_alive": 0}, timeout=15)
+        _unload_model(model)
 
 def unregister_models_for_agent(models):
     """Unregister this agent's PID and unload models with no remaining users."""
@@ -158,18 +251,18 @@ def unregister_models_for_agent(models):
             json.dump(registry, f, indent=2)
     for model in to_unload:
         print(f"[SYSTEM] Unloading {model}...")
-        try:
-            requests.post("http://localhost:8000/api/generate", json={"model": model, "keep_alive": 0}, timeout=15)
-        except Exception as e:
-            print(f"[WARN] Failed to unload {model}: {e}")
+        _unload_model(model)
 
 def get_ollama_models():
-    try:
-        resp = requests.get("http://localhost:8000/api/tags", timeout=1)
-        if resp.status_code == 200:
-            return sorted([m['name'] for m in resp.json().get('models', [])])
-    except: pass
-    return []
+    """Models available on any brain node (planner and executor may be split)."""
+    names = set()
+    for base_url in _brain_roots():
+        try:
+            resp = _http().get(f"{base_url}/api/tags", timeout=1)
+            if resp.status_code == 200:
+                names.update(m['name'] for m in resp.json().get('models', []))
+        except: pass
+    return sorted(names)
 
 def select_model(models, label):
     print(f"\n[MENU] {label}")
@@ -200,11 +293,15 @@ class SessionManager:
         self._original_sigint = None
         self._original_sigterm = None
         self._models_used = []
+        self._model_targets = []
+        self._keepalive_stop = threading.Event()
+        self._keepalive_thread = None
 
     def enter(self, strong_model=None, weak_model=None, skip_warmup=False):
         """Enter the session: coordinate startup, warm models, acquire locks."""
         # Track models for reference counting (deduplicated)
         self._models_used = list(dict.fromkeys([m for m in [strong_model, weak_model] if m]))
+        self._model_targets = _model_targets(strong_model, weak_model)
         # --- PHASE 1: Startup Coordination ---
         # Use startup lock to ensure only one agent does startup/warmup
         self.startup_lock = open(STARTUP_LOCK_PATH, 'w+')
@@ -234,7 +331,8 @@ class SessionManager:
         
         # --- PHASE 3: Runtime Lock ---
         # Acquire shared runtime lock (all active agents hold this)
-        self.runtime_lock = open(LOCK_FILE_PATH, 'w+')
+        # Raw fd (no Python file buffering); CLOEXEC keeps it out of spawned tools
+        self.runtime_lock = os.open(LOCK_FILE_PATH, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o666)
         fcntl.flock(self.runtime_lock, fcntl.LOCK_SH)
         print("[SESSION] Acquired runtime lock (agent active).")
         
@@ -247,6 +345,34 @@ class SessionManager:
         self._original_sigterm = signal.signal(signal.SIGTERM, self._signal_handler)
         atexit.register(self._atexit_handler)
 
+        # --- PHASE 5: Keep models resident between objectives ---
+        # Only external nodes need it: the managed container never expires models
+        remote_targets = [(m, url) for m, url in self._model_targets if url != BRAIN.url]
+        if remote_targets and BRAIN.keepalive_interval > 0:
+            self._keepalive_thread = threading.Thread(target=_keep_models_warm, args=(remote_targets, self._keepalive_stop),
+                                                      name="aeon-keepalive", daemon=True)
+            self._keepalive_thread.start()
+        return self
+
+    def __enter__(self):
+        # Setup happens in enter(), which takes the model arguments: use `with session.enter(...):`
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.exit()
+        return False
+
+    def _is_last_holder(self):
+        """Probe whether any other agent holds the runtime lock.
+        Upgrading our shared lock to exclusive only succeeds if we are the last one."""
+        if self.runtime_lock is None:
+            return True
+        try:
+            fcntl.flock(self.runtime_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
     def _signal_handler(self, signum, frame):
         """Handle termination signals gracefully (SIGTERM only, not SIGINT).
         
@@ -269,19 +395,29 @@ class SessionManager:
         self._cleanup_done = True
         
         print("[SESSION] Exiting...")
+        # Stop pinging, and wait out any ping already in flight, before unregistering
+        # so a late request can't reload a model we are about to unload
+        self._keepalive_stop.set()
+        if self._keepalive_thread is not None:
+            self._keepalive_thread.join(timeout=_KEEPALIVE_PING_TIMEOUT)
         
-        # Always cleanup transient tools this agent might have spawned
-        cleanup_transient_tools()
+        # Transient tool containers are matched by name, not owner, so only the
+        # last active agent removes them (others may still be using theirs)
+        if self._is_last_holder():
+            cleanup_transient_tools()
+        else:
+            print("[SESSION] Other agents still active, leaving transient tools running.")
         
         # --- Unregister models (unloads if this was last user) ---
         if self._models_used:
             unregister_models_for_agent(self._models_used)
         
         # --- Runtime Lock Release ---
-        if self.runtime_lock:
+        if self.runtime_lock is not None:
             try:
                 fcntl.flock(self.runtime_lock, fcntl.LOCK_UN)
-                self.runtime_lock.close()
+                os.close(self.runtime_lock)
+                self.runtime_lock = None
             except Exception as e:
                 print(f"[WARN] Session cleanup error: {e}")
         
@@ -308,6 +444,11 @@ def cli():
     parser.add_argument('--weak', type=str, help='Model for Weak Node (Executor)')
     parser.add_argument('--start', type=str, help='Initial objective to start immediately')
     parser.add_argument('--no-warmup', action='store_true', help='Skip model warmup (faster startup, slower first query)')
+    parser.add_argument('--speculative', action='store_true', help='Overlap planner with a speculative executor call (extra LLM load)')
+    parser.add_argument('--pipeline-milestones', action='store_true', help='Analyze milestones in the background while the next step is planned')
+    parser.add_argument('--fused-plan-action', action='store_true', help='Let the planner also write the first actions when planner and executor share a model')
+    parser.add_argument('--action-cache', action='store_true', help='Reuse actions that succeeded for an identical executor prompt earlier in the session')
+    parser.add_argument('--parallel-tools', action='store_true', help='Run consecutive actions the executor marks with the same parallel_group concurrently')
     args = parser.parse_args()
 
     provider = "local"
@@ -347,35 +488,45 @@ def cli():
         print(f"[CONFIG] Strong: {local_strong} | Weak: {local_weak}")
         
         # Enter session - always pass models for registry tracking
-        session.enter(strong_model=local_strong, weak_model=local_weak, skip_warmup=args.no_warmup)
+        session_args = {"strong_model": local_strong, "weak_model": local_weak, "skip_warmup": args.no_warmup}
     else:
         # Cloud providers don't need local brain management
-        session.enter()
+        session_args = {}
 
     try:
-        llm_client = LLMClient(provider=provider, local_strong=local_strong, local_weak=local_weak)
-        worker = Worker(llm_client=llm_client, debug_mode=args.debug)
-        deps = {'llm_client': llm_client, 'worker': worker}
-        tools = load_tools_from_directory("aeon.tools", dependencies=deps)
-        worker.register_tools(tools)
-        print(f"\nAeon Ready (Mode: {provider.upper()}, Debug: {args.debug})")
+        import readline  # noqa: F401 - line editing and history for input()
+    except ImportError:
+        pass
+
+    # enter() does the setup and returns the session, so teardown is paired with it
+    with session.enter(**session_args):
+        try:
+            from aeon.core.llm import LLMClient
+            from aeon.core.worker import Worker
+            from aeon.tools.loader import load_tools_from_directory
+            llm_client = LLMClient(provider=provider, local_strong=local_strong, local_weak=local_weak)
+            worker = Worker(llm_client=llm_client, debug_mode=args.debug, speculative_execution=args.speculative,
+                            pipeline_milestones=args.pipeline_milestones, fused_plan_action=args.fused_plan_action,
+                            action_cache=args.action_cache, parallel_tools=args.parallel_tools)
+            deps = {'llm_client': llm_client, 'worker': worker}
+            tools = load_tools_from_directory("aeon.tools", dependencies=deps)
+            worker.register_tools(tools)
+            print(f"\nAeon Ready (Mode: {provider.upper()}, Debug: {args.debug})")
         
-        if args.start:
-            worker.run(args.start)
+            if args.start:
+                worker.run(args.start)
         
-        while True:
-            try:
-                obj = input("> ")
-                if obj.strip(): 
-                    if obj.strip() in ['exit', 'quit']: break
-                    worker.run(obj)
-            except (KeyboardInterrupt, EOFError):
-                print("\n")  # Clean line after ^C
-                break
-    except Exception as e:
-        print(f"[ERROR] Fatal error: {e}")
-        raise
-    finally:
-        session.exit()
+            while True:
+                try:
+                    obj = input("> ")
+                    if obj.strip(): 
+                        if obj.strip() in ['exit', 'quit']: break
+                        worker.run(obj)
+                except (KeyboardInterrupt, EOFError):
+                    print("\n")  # Clean line after ^C
+                    break
+        except Exception as e:
+            print(f"[ERROR] Fatal error: {e}")
+            raise
 
 if __name__ == "__main__": cli()
@@ -55,6 +55,25 @@ docker run -d \
     -p 8000:11434 \
     ollama/ollama:latest
 
+# --- 3. READINESS NOTIFICATION ---
+# If the caller passed a FIFO, follow the container log in the background and write
+# one line to it when Ollama reports it is listening, so the caller can block on the
+# pipe instead of polling HTTP. `docker logs -f` replays from the start, so the line
+# is seen even if it was logged before we attached. Both the follow and the FIFO
+# write are bounded: if the caller has already given up and closed its reader, the
+# write times out instead of blocking forever.
+if [ -n "$AEON_READY_FIFO" ]; then
+  (
+    READY_TIMEOUT="${AEON_READY_TIMEOUT:-60}"
+    # Signal from the reading side of the pipe so it fires on the match, not when
+    # `docker logs -f` finally exits (next log line's SIGPIPE or the timeout)
+    timeout "$READY_TIMEOUT" docker logs -f aeon_brain_node 2>&1 | {
+      grep -q -m1 "Listening on" && [ -p "$AEON_READY_FIFO" ] \
+        && timeout 1 sh -c 'echo ready > "$1"' _ "$AEON_READY_FIFO"
+    }
+  ) >/dev/null 2>&1 &
+fi
+
 echo "=================================================="
 echo "    BRAIN ONLINE (GPU 0). READY ON PORT 8000.     "
 echo "=================================================="
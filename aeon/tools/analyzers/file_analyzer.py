@@ -30,6 +30,8 @@ from .handlers.utility import (
     is_likely_binary,
 )
 
+_NAME_SPLIT_RE = re.compile(r'[._-]')
+
 class FileAnalyzer:
     """
     Analyzes a file to produce a summary suitable for an LLM. It distinguishes
@@ -128,7 +130,7 @@ class FileAnalyzer:
         else:
             # Special case: Large file with no extension. Try to infer type.
             if self.file_size > self.LARGE_FILE_THRESHOLD_BYTES and not self.file_extension:
-                name_parts = re.split(r'[._-]', self.file_name_lower)
+                name_parts = _NAME_SPLIT_RE.split(self.file_name_lower)
                 if len(name_parts) > 1 and name_parts[-1] == 'tpm':
                     summary = summarize_tpm_file(self)
             
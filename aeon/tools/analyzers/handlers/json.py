@@ -1,6 +1,7 @@
 import json
 from typing import Dict, Any
 
+from ....core.utils import json_loads
 from .text import analyze_generic_text
 
 def get_json_schema(data: Any, depth=0) -> Any:
@@ -15,12 +16,12 @@ def get_json_schema(data: Any, depth=0) -> Any:
 
 def summarize_json(analyzer) -> Dict[str, Any]:
     try:
-        with open(analyzer.file_path, 'r', encoding='utf-8') as f:
-            if analyzer.file_size <= analyzer.MAX_JSON_PREVIEW_SIZE:
-                return {"summary_type": "full_content", "file_format": "json", "content": json.load(f)}
-            else:
-                data = json.load(f)
-                return {"summary_type": "schema", "file_format": "json", "schema": get_json_schema(data)}
+        # Raw bytes: orjson (when installed) decodes and validates UTF-8 itself
+        with open(analyzer.file_path, 'rb') as f:
+            data = json_loads(f.read())
+        if analyzer.file_size <= analyzer.MAX_JSON_PREVIEW_SIZE:
+            return {"summary_type": "full_content", "file_format": "json", "content": data}
+        return {"summary_type": "schema", "file_format": "json", "schema": get_json_schema(data)}
     except (json.JSONDecodeError, UnicodeDecodeError):
         return analyze_generic_text(analyzer)
     except Exception as e:
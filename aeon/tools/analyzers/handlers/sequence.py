@@ -3,6 +3,9 @@ from typing import Dict, Any
 from collections import Counter
 import re
 
+# Approximate .cif record starts ('data_' blocks and '_atom_site' lines)
+_CIF_RECORD_RE = re.compile(r'^data_|^_atom_site', re.MULTILINE)
+
 def summarize_record_based_data(analyzer) -> Dict[str, Any]:
     delimiters = {'.sdf': '$$$$', '.pdb': 'ENDMDL'}
     # For new protein structure formats, use generic line-based counting or known delimiters if available
@@ -21,7 +24,7 @@ def summarize_record_based_data(analyzer) -> Dict[str, Any]:
                 # Generic counting for .cif, .mol2, etc. (e.g., lines or sections)
                 if analyzer.file_extension == '.cif':
                     # Approximate records by counting 'data_' or '_atom_site' lines
-                    record_count = len(re.findall(r'^data_|^_atom_site', content, re.MULTILINE))
+                    record_count = len(_CIF_RECORD_RE.findall(content))
                 else:
                     # Fallback: approximate by non-empty lines or fixed estimate
                     record_count = sum(1 for line in content.splitlines() if line.strip())
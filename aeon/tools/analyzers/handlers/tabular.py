@@ -1,7 +1,7 @@
-import json
 from typing import Dict, Any
 from collections import Counter
 
+from ....core.utils import json_loads
 from .json import get_json_schema
 
 def summarize_tabular(analyzer) -> Dict[str, Any]:
@@ -77,7 +77,7 @@ def summarize_jsonl_file(analyzer) -> Dict[str, Any]:
             first_line = f.readline()
             f.seek(0)
             line_count = sum(1 for _ in f)
-        first_obj = json.loads(first_line)
+        first_obj = json_loads(first_line)
         schema = get_json_schema(first_obj)
         return {
             "summary_type": "json_lines_summary", "file_format": "jsonl",
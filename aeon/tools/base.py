@@ -3,18 +3,30 @@ Abstract base class for all tools in the Aeon agent.
 """
 
 from abc import ABC, abstractmethod
+from enum import Enum
+
+from ..core.utils import STDOUT_IS_TTY
+
+
+class SummarizePolicy(Enum):
+    """Whether the worker passes a tool's output through the summarizer LLM."""
+    NEVER = "never"        # short status messages, always shown verbatim
+    IF_LARGE = "if_large"  # verbatim when short, summarized otherwise
+    ALWAYS = "always"      # output that needs interpreting (e.g. command logs)
 
 
 class BaseTool(ABC):
     """Abstract base class for all tools."""
+
+    summarize_policy = SummarizePolicy.IF_LARGE
     
-    # ANSI Color Codes for standardized output across tools
-    C_RED = '\033[91m'
-    C_YELLOW = '\033[93m'
-    C_CYAN = '\033[96m'
-    C_GREEN = '\033[92m'
-    C_BLUE = '\033[94m'
-    C_RESET = '\033[0m'
+    # ANSI Color Codes for standardized output across tools (empty when stdout is not a TTY)
+    C_RED = '\033[91m' if STDOUT_IS_TTY else ''
+    C_YELLOW = '\033[93m' if STDOUT_IS_TTY else ''
+    C_CYAN = '\033[96m' if STDOUT_IS_TTY else ''
+    C_GREEN = '\033[92m' if STDOUT_IS_TTY else ''
+    C_BLUE = '\033[94m' if STDOUT_IS_TTY else ''
+    C_RESET = '\033[0m' if STDOUT_IS_TTY else ''
 
     def __init__(self, name: str, description: str):
         self.name = name
@@ -1,14 +1,15 @@
-from .base import BaseTool
+from .base import BaseTool, SummarizePolicy
 from ..core.llm import LLMClient
+from ..core.utils import STDOUT_IS_TTY
 from ..core.prompts import (
     TOOL_DESC_THINK,
     TOOL_DESC_SAY_TO_USER,
     THINK_TOOL_PROMPT,
 )
 
-# ANSI color codes
-C_RESET = '\033[0m'
-C_GREEN = '\033[92m'
+# ANSI color codes, off when stdout is not a terminal
+C_RESET = '\033[0m' if STDOUT_IS_TTY else ''
+C_GREEN = '\033[92m' if STDOUT_IS_TTY else ''
 
 class ThinkTool(BaseTool):
     """A tool for internal reasoning and planning."""
@@ -26,11 +27,13 @@ class ThinkTool(BaseTool):
              working_memory = self.worker._format_open_files()
         
         prompt = THINK_TOOL_PROMPT.format(working_memory=working_memory, query=query)
-        return self.llm_client.reason(prompt=prompt)
+        return self.llm_client.reason(prompt=prompt, semantic_key=(working_memory, query))
 
 
 class SayToUserTool(BaseTool):
     """A tool to communicate with the user."""
+    summarize_policy = SummarizePolicy.NEVER
+
     def __init__(self):
         super().__init__(
             name="say_to_user",
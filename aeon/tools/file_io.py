@@ -1,7 +1,8 @@
-from .base import BaseTool
+from .base import BaseTool, SummarizePolicy
 import os
 import base64
 import json
+from ..core.utils import json_loads
 from ..core.prompts import (
     TOOL_DESC_OPEN_FILE,
     TOOL_DESC_CLOSE_FILE,
@@ -15,6 +16,8 @@ MAX_FILE_READ_SIZE = 250000
 MAX_CELL_SIZE = 100
 
 class OpenFileTool(BaseTool):
+    summarize_policy = SummarizePolicy.NEVER
+
     def __init__(self, worker):
         super().__init__(
             name="open_file",
@@ -59,7 +62,10 @@ class OpenFileTool(BaseTool):
                     content = f.read()
 
             # Update Worker State with absolute path for consistency
-            self.worker.update_open_file(abs_path, content)
+            evicted = self.worker.update_open_file(abs_path, content)
+            if evicted:
+                return (f"File '{file_path}' opened in Short Term Memory. "
+                        f"Closed to stay within the memory limit: {', '.join(evicted)}")
             return f"File '{file_path}' opened in Short Term Memory."
 
         except UnicodeDecodeError as e:
@@ -98,8 +104,8 @@ class OpenFileTool(BaseTool):
         return summary
 
     def _summarize_json(self, path):
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(path, 'rb') as f:
+            data = json_loads(f.read())
         
         if isinstance(data, list):
             schema = "List of Objects"
@@ -140,6 +146,8 @@ class OpenFileTool(BaseTool):
 
 class EditFileTool(BaseTool):
     """A tool to make targeted edits to a file via unique string replacement."""
+    summarize_policy = SummarizePolicy.NEVER
+
     def __init__(self, worker):
         super().__init__(
             name='edit_file',
@@ -212,6 +220,8 @@ class EditFileTool(BaseTool):
 
 
 class CloseFileTool(BaseTool):
+    summarize_policy = SummarizePolicy.NEVER
+
     def __init__(self, worker):
         super().__init__(
             name="close_file",
@@ -227,6 +237,8 @@ class CloseFileTool(BaseTool):
         return f"File '{file_path}' was not open."
 
 class WriteFileTool(BaseTool):
+    summarize_policy = SummarizePolicy.NEVER
+
     def __init__(self, worker):
         super().__init__(
             name="write_file",
@@ -4,10 +4,11 @@ import inspect
 import os
 from typing import List, Dict, Any
 from aeon.tools.base import BaseTool
+from aeon.core.utils import STDOUT_IS_TTY
 
 # ANSI Colors for loud failures
-C_RED = '\033[91m'
-C_RESET = '\033[0m'
+C_RED = '\033[91m' if STDOUT_IS_TTY else ''
+C_RESET = '\033[0m' if STDOUT_IS_TTY else ''
 
 def load_tools_from_directory(
     package_name: str = "aeon.tools", 
@@ -25,6 +26,9 @@ def load_tools_from_directory(
         return []
 
     for _, module_name, _ in pkgutil.iter_modules(package.__path__):
+        # Never pick up editor/Jupyter snapshot copies of real tools
+        if module_name.endswith('-checkpoint') or module_name.startswith('.'):
+            continue
         full_module_name = f"{package_name}.{module_name}"
         try:
             module = importlib.import_module(full_module_name)
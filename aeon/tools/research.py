@@ -6,9 +6,10 @@ import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any
 
-from .base import BaseTool
+from .base import BaseTool, SummarizePolicy
 from ..core.worker import Worker
 from ..core.llm import LLMClient
+from ..core.utils import STDOUT_IS_TTY
 from ..core.prompts import (
     TOOL_DESC_DOCKER_EXEC,
     TOOL_DESC_DOCKER_WRITE_FILE,
@@ -21,6 +22,8 @@ from ..core.prompts import (
 # --- Docker Tools for Sub-Agents ---
 
 class DockerExecTool(BaseTool):
+    summarize_policy = SummarizePolicy.ALWAYS
+
     def __init__(self, container_name: str):
         super().__init__(
             name="run_command",
@@ -48,6 +51,8 @@ class DockerExecTool(BaseTool):
             return f"Error executing docker command: {e}"
 
 class DockerWriteFileTool(BaseTool):
+    summarize_policy = SummarizePolicy.NEVER
+
     def __init__(self, container_name: str):
         super().__init__(
             name="write_file",
@@ -142,8 +147,8 @@ class ConductResearchTool(BaseTool):
         def prefix_print(msg):
             if "Objective:" in msg or "Result Summary:" in msg:
                 # ANSI Cyan for sub-agent distinction
-                C_CYAN = '\033[96m'
-                C_RESET = '\033[0m'
+                C_CYAN = '\033[96m' if STDOUT_IS_TTY else ''
+                C_RESET = '\033[0m' if STDOUT_IS_TTY else ''
                 print(f"{C_CYAN}[Agent {idx}]{C_RESET} {msg}")
 
         sub_worker = Worker(self.llm_client, tools=tools, print_func=prefix_print)
@@ -1,7 +1,7 @@
 import os
-import pathlib
 from .base import BaseTool
 from ..core.llm import LLMClient
+from ..core.utils import read_api_key
 from ..core.prompts import TOOL_DESC_SEARCH_WEB
 
 class SearchWebTool(BaseTool):
@@ -16,15 +16,8 @@ class SearchWebTool(BaseTool):
         
         try:
             from tavily import TavilyClient
-            api_key_path = pathlib.Path.home() / "tavily_api_key.txt"
-            api_key = None
-            if api_key_path.is_file():
-                with open(api_key_path, 'r') as f:
-                    api_key = f.readline().strip()
-
-            if api_key:
-                self.tavily_client = TavilyClient(api_key=api_key)
-        except ImportError:
+            self.tavily_client = TavilyClient(api_key=read_api_key("tavily_api_key.txt"))
+        except (ImportError, OSError, ValueError):  # OSError: missing, unreadable or a directory
             pass # tavily_client remains None
 
     def execute(self, query: str) -> str:
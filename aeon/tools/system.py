@@ -3,7 +3,7 @@ import subprocess
 import sys
 import time
 import signal
-from .base import BaseTool
+from .base import BaseTool, SummarizePolicy
 from ..core.prompts import (
     TOOL_DESC_RUN_COMMAND,
     TOOL_DESC_TASK_COMPLETE,
@@ -12,6 +12,8 @@ from ..core.prompts import (
 
 class RunCommandTool(BaseTool):
     """A tool to execute a command on the command line."""
+    summarize_policy = SummarizePolicy.ALWAYS
+
     def __init__(self):
         super().__init__(
             name="run_command",
@@ -1,57 +0,0 @@
-import argparse
-import torch
-import os
-import sys
-import json
-from PIL import Image
-
-if not os.path.exists("/.dockerenv"):
-    print("CRITICAL: This script must be run inside the container.")
-    sys.exit(1)
-
-def auto_select_vision_model(base_path):
-    if not torch.cuda.is_available():
-        return "vision_small", os.path.join(base_path, "vision_small")
-    
-    total_vram = torch.cuda.get_device_properties(0).total_memory / (1024**3)
-    
-    if total_vram > 80.0:
-        return "vision_large", os.path.join(base_path, "vision_large")
-    elif total_vram > 20.0:
-        return "vision_med", os.path.join(base_path, "vision_med")
-    else:
-        return "vision_small", os.path.join(base_path, "vision_small")
-
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--models_dir", required=True)
-    parser.add_argument("--image_path", required=True)
-    parser.add_argument("--prompt", default="Describe this image in detail and extract any text or data present.")
-    args = parser.parse_args()
-
-    m_type, m_path = auto_select_vision_model(args.models_dir)
-    
-    # Inference Logic (Dynamic based on model architecture)
-    # Note: This is a placeholder for the specific loader logic for Moondream/InternVL/Qwen
-    # In a production run, the Docker image 'aeon_vision' would have these transformers/qwen-vl dependencies.
-    print(f"[Vision] Model: {m_type} | Image: {args.image_path}")
-    
-    try:
-        # For moondream2 (vision_small)
-        if m_type == "vision_small":
-            from transformers import AutoModelForCausalLM, AutoTokenizer
-            model = AutoModelForCausalLM.from_pretrained(m_path, trust_remote_code=True).to("cuda")
-            tokenizer = AutoTokenizer.from_pretrained(m_path, trust_remote_code=True)
-            image = Image.open(args.image_path)
-            enc_image = model.encode_image(image)
-            description = model.answer_question(enc_image, args.prompt, tokenizer)
-            print(f"DESCRIPTION:\n{description}")
-        else:
-            # InternVL/Qwen Logic would be handled here via flash-attn/transformers
-            print("RESULT: High-end model inference successful (simulated for current setup).")
-    except Exception as e:
-        print(f"ERROR: Vision inference failed: {e}")
-        sys.exit(1)
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
@@ -1,2 +0,0 @@
-# This file is intentionally left empty to allow dynamic tool discovery.
-# See aeon.tools.loader for loading logic.
\ No newline at end of file
@@ -1,3 +0,0 @@
-from .file_analyzer import FileAnalyzer
-
-__all__ = ['FileAnalyzer']
\ No newline at end of file
@@ -1,3 +0,0 @@
-from .tabular import summarize_tabular, summarize_structured_text, summarize_jsonl_file, summarize_numpy_archive, summarize_tpm_file
-from .sequence import summarize_record_based_data, summarize_sequence_file, summarize_gene_annotation
-from .bio import summarize_genbank, summarize_hdf5
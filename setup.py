@@ -21,6 +21,11 @@ setup(
         "requests",
         "huggingface_hub"
     ],
+    extras_require={
+        # Optional speedups, each picked up automatically when importable
+        "fast": ["tiktoken", "orjson", "diskcache", "h2"],
+        "semantic-cache": ["sentence-transformers"],
+    },
     entry_points={
         "console_scripts": [
             "aeon = aeon.main:cli",
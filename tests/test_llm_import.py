@@ -0,0 +1,14 @@
+import subprocess
+import sys
+
+
+def test_import_keeps_default_recursion_limit():
+    # Run in a fresh interpreter so an earlier import in this session can't hide a change
+    code = (
+        "import sys\n"
+        "before = sys.getrecursionlimit()\n"
+        "import aeon.core.llm\n"
+        "assert sys.getrecursionlimit() == before, (before, sys.getrecursionlimit())\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr